@@ -30,7 +30,6 @@ import logging
 import os
 import sys
 import time
-from datetime import datetime
 
 import pytest
 
@@ -45,6 +44,13 @@ def log_output(message):
     sys.stderr.flush()
 
 
+def log_lines(lines):
+    """Write lines to stderr without joining them into one string first."""
+    sys.stderr.write("\n")
+    sys.stderr.writelines(f"{line}\n" for line in lines)
+    sys.stderr.flush()
+
+
 @pytest.fixture(scope="session")
 def fixture_tracker(make_shared_json):
     """Shared tracker for monitoring fixture creation across workers.
@@ -53,17 +59,14 @@ def fixture_tracker(make_shared_json):
     """
     def print_report(shared_json):
         """Print final report of fixture creation across all workers."""
-        data = shared_json.read()
-        workers = data.get("workers", {})
+        workers = shared_json.read_view().get("workers") or {}
 
         if not workers:
             logger.warning("No workers recorded in tracker")
             return
 
-        # Sort workers by entry time (when they entered the rate limiter)
-        sorted_workers = sorted(workers.items(), key=lambda x: x[1]["entry_time"])
-
-        # Build report
+        # Build report in a single pass over workers sorted by entry time
+        # (when they entered the rate limiter)
         report_lines = [
             "",
             "=" * 70,
@@ -74,23 +77,27 @@ def fixture_tracker(make_shared_json):
             "Burst capacity: 1",
         ]
 
-        for i, (wid, info) in enumerate(sorted_workers):
+        total_wait = 0.0
+        first_entry = float("inf")
+        last_exit = float("-inf")
+        for i, (wid, info) in enumerate(sorted(workers.items(), key=lambda x: x[1]["entry_time"])):
+            total_wait += info["waited"]
+            first_entry = min(first_entry, info["entry_time"])
+            last_exit = max(last_exit, info["exit_time"])
+
             report_lines.append(f"\nWorker {i+1} ({wid}):")
             report_lines.append(f"  • Waited: {info['waited']:.2f} seconds")
             report_lines.append(f"  • Call count: {info['call_count']}")
-            entry_time = datetime.fromtimestamp(info['entry_time']).strftime('%H:%M:%S')
-            exit_time = datetime.fromtimestamp(info['exit_time']).strftime('%H:%M:%S')
+            entry_time = time.strftime("%H:%M:%S", time.localtime(info["entry_time"]))
+            exit_time = time.strftime("%H:%M:%S", time.localtime(info["exit_time"]))
             report_lines.append(f"  • Entry time: {entry_time}")
             report_lines.append(f"  • Exit time: {exit_time}")
 
-        # Calculate statistics
-        total_wait = sum(w["waited"] for _, w in sorted_workers)
+        # Summary statistics
         report_lines.append(f"\n{'=' * 70}")
         report_lines.append(f"Total wait time across all workers: {total_wait:.2f}s")
 
         if len(workers) >= 2:
-            first_entry = min(w["entry_time"] for _, w in sorted_workers)
-            last_exit = max(w["exit_time"] for _, w in sorted_workers)
             total_duration = last_exit - first_entry
             report_lines.append(f"Time from first entry to last exit: {total_duration:.2f}s")
 
@@ -101,8 +108,7 @@ def fixture_tracker(make_shared_json):
 
         report_lines.append("=" * 70)
 
-
-        log_output("\n" + "\n".join(report_lines))
+        log_lines(report_lines)
 
     return make_shared_json(
         name="session_fixture_tracker",
@@ -163,13 +169,10 @@ def throttled_session_fixture(session_throttler, fixture_tracker, worker_id):
 
 def wait_for_all_workers(tracker, expected_workers, timeout=30):
     """Wait for all workers to complete fixture creation."""
-    start = time.time()
-    while time.time() - start < timeout:
-        data = tracker.read()
-        if data.get("total_workers", 0) >= expected_workers:
-            return True
-        time.sleep(0.1)
-    return False
+    return tracker.wait_for(
+        lambda data: data.get("total_workers", 0) >= expected_workers,
+        timeout=timeout,
+    )
 
 
 # Generate one test per expected worker
@@ -196,15 +199,16 @@ def test_verify_rate_limiting(throttled_session_fixture, fixture_tracker):
     assert wait_for_all_workers(fixture_tracker, expected_workers=2, timeout=30), \
         "Timeout waiting for all workers"
 
-    data = fixture_tracker.read()
-    workers = data.get("workers", {})
+    workers = fixture_tracker.read_view().get("workers") or {}
 
     # Should have 2 workers (gw0 and gw1)
     assert len(workers) >= 1, f"Expected at least 1 worker, got {len(workers)}"
 
 
     # Verify pacing worked
-    total_wait = sum(w["waited"] for w in workers.values())
+    total_wait = 0.0
+    for info in workers.values():
+        total_wait += info["waited"]
     # With rate of 15/minute (4s between calls) and burst_capacity=1,
     # at least one worker should have waited significantly
     assert total_wait > 2, (
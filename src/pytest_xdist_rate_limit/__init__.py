@@ -10,6 +10,7 @@ from .exceptions import RateLimitTimeout
 from .rate import Rate, RateLimit  # RateLimit is deprecated, use Rate
 from .rate_limiter_fixture import make_pacer, make_rate_limiter
 from .shared_json import SharedJson, make_shared_json
+from .shared_struct import SharedStruct
 from .token_bucket_rate_limiter import TokenBucketPacer
 
 # Backward compatibility aliases
@@ -21,6 +22,7 @@ __all__ = [
     "make_pacer",
     "make_rate_limiter",  # Deprecated, use make_pacer
     "SharedJson",
+    "SharedStruct",
     "Rate",
     "RateLimit",  # Deprecated, use Rate
     "RateLimitTimeout",
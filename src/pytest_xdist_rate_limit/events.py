@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from fastdigest import TDigest
@@ -16,11 +17,13 @@ if TYPE_CHECKING:
     from pytest_xdist_rate_limit.token_bucket_rate_limiter import TokenBucketPacer
 
 
-@dataclass
+@dataclass(frozen=True)
 class PacerEvent:
     """Base class for all pacer events.
 
-    Provides common context available to all callback events.
+    Provides common context available to all callback events. Events are frozen
+    snapshots: callbacks can read them but not reassign their fields. Values taken
+    from state_snapshot are looked up once and cached on the event.
 
     Attributes:
         limiter_id: Unique identifier for the pacer
@@ -31,17 +34,17 @@ class PacerEvent:
     limiter: TokenBucketPacer
     state_snapshot: Dict[str, Any]
 
-    @property
+    @cached_property
     def call_count(self) -> int:
         """Total number of calls made."""
         return self.state_snapshot['call_count']
 
-    @property
+    @cached_property
     def exceptions(self) -> int:
         """Total number of exceptions encountered."""
         return self.state_snapshot['exceptions']
 
-    @property
+    @cached_property
     def start_time(self) -> float:
         """Unix timestamp of when the first call was made."""
         return self.state_snapshot['start_time']
@@ -52,7 +55,7 @@ class PacerEvent:
         return time.time() - self.start_time
 
 
-@dataclass
+@dataclass(frozen=True)
 class DriftEvent(PacerEvent):
     """Event fired when rate drift exceeds the configured threshold.
 
@@ -68,7 +71,7 @@ class DriftEvent(PacerEvent):
     max_drift: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class MaxCallsEvent(PacerEvent):
     """Event fired when the max_calls limit is reached.
 
@@ -78,13 +81,14 @@ class MaxCallsEvent(PacerEvent):
     max_calls: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class PeriodicCheckEvent(PacerEvent):
     """Event fired during periodic checks with current metrics.
 
     Provides comprehensive distribution-based statistics for load test analysis and
     bottleneck detection. Uses TDigest for accurate percentile calculations without
-    storing all samples.
+    storing all samples. Percentiles and wait_ratio are computed on first access and
+    cached on the event.
 
     Attributes:
         worker_count: Number of workers detected from environment
@@ -105,37 +109,37 @@ class PeriodicCheckEvent(PacerEvent):
     current_rate: float
     drift: Optional[float]
 
-    @property
+    @cached_property
     def duration_p50(self) -> Optional[float]:
         """Median call duration in seconds."""
         return self.duration_digest.percentile(50) if self.duration_digest else None
 
-    @property
+    @cached_property
     def duration_p90(self) -> Optional[float]:
         """90th percentile call duration in seconds."""
         return self.duration_digest.percentile(90) if self.duration_digest else None
 
-    @property
+    @cached_property
     def duration_p99(self) -> Optional[float]:
         """99th percentile call duration in seconds."""
         return self.duration_digest.percentile(99) if self.duration_digest else None
 
-    @property
+    @cached_property
     def wait_p50(self) -> Optional[float]:
         """Median wait time in seconds."""
         return self.wait_digest.percentile(50) if self.wait_digest else None
 
-    @property
+    @cached_property
     def wait_p90(self) -> Optional[float]:
         """90th percentile wait time in seconds."""
         return self.wait_digest.percentile(90) if self.wait_digest else None
 
-    @property
+    @cached_property
     def wait_p99(self) -> Optional[float]:
         """99th percentile wait time in seconds."""
         return self.wait_digest.percentile(99) if self.wait_digest else None
 
-    @property
+    @cached_property
     def wait_ratio(self) -> Optional[float]:
         """Ratio of median wait time to median call duration.
 
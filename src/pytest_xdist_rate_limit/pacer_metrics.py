@@ -5,11 +5,71 @@ This module provides statistics tracking functionality for the pacer,
 including TDigest-based percentile calculations and windowed rate tracking.
 """
 
+import base64
+import bisect
 import time
-from typing import Any, Dict, List, Optional
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastdigest import TDigest
 
+# Samples buffered in the statistics state before they are merged into the digest
+DIGEST_FLUSH_THRESHOLD = 100
+# Upper bound on centroids per digest; keeps the persisted digest (and the cost of
+# rebuilding it) constant however many samples a session records
+DIGEST_MAX_CENTROIDS = 1000
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+def _pack_floats(values: List[float]) -> str:
+    """Encode floats as base64 of their packed doubles."""
+    return base64.b64encode(array("d", values).tobytes()).decode("ascii")
+
+
+def _unpack_floats(blob: str) -> List[float]:
+    """Decode floats packed by _pack_floats."""
+    values = array("d")
+    values.frombytes(base64.b64decode(blob))
+    return values.tolist()
+
+
+def _digest_to_blob(digest: TDigest) -> Dict[str, Any]:
+    """Serialize a digest with its centroids packed into two base64 strings.
+
+    The centroid list is the bulk of TDigest.to_dict(); storing it as packed
+    means and weights keeps the shared state small and cheap to (de)serialize.
+    Any other keys of to_dict() are kept as they are.
+
+    Args:
+        digest: Digest to serialize
+
+    Returns:
+        JSON-serializable dict accepted by _blob_to_digest
+    """
+    data = digest.to_dict()
+    centroids = data.pop("centroids", [])
+    data["means"] = _pack_floats([c["m"] for c in centroids])
+    data["weights"] = _pack_floats([c["c"] for c in centroids])
+    return data
+
+
+def _blob_to_digest(data: Dict[str, Any]) -> TDigest:
+    """Rebuild a digest serialized by _digest_to_blob (or plain TDigest.to_dict()).
+
+    Args:
+        data: Serialized digest
+
+    Returns:
+        TDigest instance
+    """
+    if "means" not in data:
+        return TDigest.from_dict(data)
+    data = dict(data)
+    means = _unpack_floats(data.pop("means"))
+    weights = _unpack_floats(data.pop("weights"))
+    data["centroids"] = [{"m": m, "c": c} for m, c in zip(means, weights)]
+    return TDigest.from_dict(data)
+
 
 class PacerMetrics:
     """
@@ -18,6 +78,13 @@ class PacerMetrics:
     Uses TDigest for accurate percentile calculations without storing all samples,
     enabling efficient tracking of call durations, wait times, and windowed rates.
 
+    New samples are appended to a raw buffer stored next to each digest and merged
+    with a single batch update once DIGEST_FLUSH_THRESHOLD samples are pending, so
+    the digest is only re-serialized on flush. The live TDigest objects are kept on
+    the instance together with the version they were last persisted under; as long
+    as no other worker has flushed since, the cached object is reused instead of
+    being rebuilt from its serialized centroids.
+
     Attributes:
         rate_windows: Time windows in seconds for rate calculation (e.g., [60, 300, 900])
     """
@@ -30,70 +97,110 @@ class PacerMetrics:
             rate_windows: Time windows in seconds for rate calculation
         """
         self.rate_windows = rate_windows
+        self._max_window_ns: Optional[int] = (
+            max(rate_windows) * NANOSECONDS_PER_SECOND if rate_windows else None
+        )
+        # (window, window length in ns, calls/hour per call counted), shortest first
+        self._window_params = [
+            (window, window * NANOSECONDS_PER_SECOND, 3600 / window if window > 0 else 0.0)
+            for window in sorted(set(rate_windows))
+        ]
+        self._live_digests: Dict[str, Tuple[int, TDigest]] = {}
+        # Digests handed out by readers, keyed by (digest version, buffered samples)
+        self._read_digests: Dict[str, Tuple[Tuple[int, int], Optional[TDigest]]] = {}
+
+    def new_state(self) -> Dict[str, Any]:
+        """Return an empty statistics state for the update methods to fill in.
+
+        Returns:
+            Statistics state dict with every key the update methods write to
+        """
+        return {
+            "sample_count": 0,
+            "duration_digest_buffer": [],
+            "duration_digest_version": 0,
+            "wait_digest_buffer": [],
+            "wait_digest_version": 0,
+            "call_timestamps": [],
+        }
+
+    def _add_sample(self, state: Dict[str, Any], key: str, value: float) -> None:
+        """Buffer a sample for the digest stored under key, flushing a full buffer.
+
+        The digest is only rebuilt from state when its version differs from the one
+        this instance last wrote, i.e. when another worker flushed in between.
+
+        Args:
+            state: Statistics state dict to update in place
+            key: Key of the serialized digest (e.g. "duration_digest")
+            value: Sample to incorporate
+        """
+        buffer_key = f"{key}_buffer"
+        buffer = state[buffer_key]
+        buffer.append(value)
+        if len(buffer) < DIGEST_FLUSH_THRESHOLD:
+            return
+
+        version_key = f"{key}_version"
+        version = state[version_key]
+        cached = self._live_digests.get(key)
+        if cached is not None and cached[0] == version:
+            digest = cached[1]
+        elif key in state:
+            digest = _blob_to_digest(state[key])
+        else:
+            digest = TDigest(max_centroids=DIGEST_MAX_CENTROIDS)
+
+        buffer.sort()
+        digest.batch_update(buffer)
+        version += 1
+        state[buffer_key] = []
+        state[key] = _digest_to_blob(digest)
+        state[version_key] = version
+        self._live_digests[key] = (version, digest)
 
     def update_duration_stats(
         self,
-        stats_state: Optional[Dict[str, Any]],
+        stats_state: Dict[str, Any],
         duration: float
     ) -> Dict[str, Any]:
-        """Return updated statistics state with new duration sample.
+        """Add a duration sample to the statistics state in place and return it.
 
         TDigest provides accurate percentile estimates with O(1) space complexity,
         making it ideal for distributed systems where storing all samples is impractical.
 
         Args:
-            stats_state: Statistics state dict or None if uninitialized
+            stats_state: Statistics state dict from new_state() to update
             duration: New call duration to incorporate (in seconds)
 
         Returns:
-            Updated statistics state dict
+            The updated statistics state dict
         """
-        if stats_state is None:
-            stats_state = {
-                "duration_digest": TDigest().to_dict(),
-                "sample_count": 0
-            }
-
-        # Work with copy to avoid mutation
-        state = dict(stats_state)
-
-        # Deserialize, update, and re-serialize
-        digest = TDigest.from_dict(state.get("duration_digest", TDigest().to_dict()))
-        digest.update(duration)
-        state["duration_digest"] = digest.to_dict()
-        state["sample_count"] = state.get("sample_count", 0) + 1
+        self._add_sample(stats_state, "duration_digest", duration)
+        stats_state["sample_count"] += 1
 
-        return state
+        return stats_state
 
     def update_wait_stats(
         self,
-        stats_state: Optional[Dict[str, Any]],
+        stats_state: Dict[str, Any],
         wait_time: float
     ) -> Dict[str, Any]:
-        """Return updated statistics state with new wait time sample.
+        """Add a wait time sample to the statistics state in place and return it.
 
         Tracks time spent waiting for pacer tokens, enabling analysis of
         whether the system is SUT-bound (low wait times) or pacer-bound (high wait times).
 
         Args:
-            stats_state: Statistics state dict or None if uninitialized
+            stats_state: Statistics state dict from new_state() to update
             wait_time: Time waited for token acquisition (in seconds)
 
         Returns:
-            Updated statistics state dict
+            The updated statistics state dict
         """
-        if stats_state is None:
-            stats_state = {"wait_digest": TDigest().to_dict()}
-
-        # Work with copy to avoid mutation
-        state = dict(stats_state)
+        self._add_sample(stats_state, "wait_digest", wait_time)
 
-        # Deserialize, update, and re-serialize
-        digest = TDigest.from_dict(state.get("wait_digest", TDigest().to_dict()))
-        digest.update(wait_time)
-        state["wait_digest"] = digest.to_dict()
-
-        return state
+        return stats_state
 
     def calculate_windowed_rates(
         self,
@@ -102,7 +209,10 @@ class PacerMetrics:
         """Calculate rates for configured time windows (read-only).
 
         Uses a sliding window approach with timestamps to calculate accurate rates
-        over different time periods (e.g., last 60s, 300s, 900s).
+        over different time periods (e.g., last 60s, 300s, 900s). The timestamps are
+        kept sorted, so each window's count is found with a binary search. Windows are
+        visited shortest first: each longer window's cutoff lies at or before the
+        previous one, so its search is bounded by the previous result.
 
         Args:
             stats_state: Statistics state dict or None if uninitialized
@@ -114,58 +224,132 @@ class PacerMetrics:
             return {window: 0.0 for window in self.rate_windows}
 
         timestamps = stats_state["call_timestamps"]
-        current_time = time.perf_counter()
+        current_ns = time.perf_counter_ns()
         rates = {}
 
-        for window in self.rate_windows:
-            # Count calls within this window
-            cutoff_time = current_time - window
-            calls_in_window = sum(1 for ts in timestamps if ts >= cutoff_time)
-
-            # Calculate rate in calls/hour
-            if window > 0:
-                rates[window] = (calls_in_window / window) * 3600
-            else:
-                rates[window] = 0.0
+        hi = len(timestamps)
+        for window, window_ns, rate_factor in self._window_params:
+            # Count calls within this window and convert to calls/hour
+            hi = bisect.bisect_left(timestamps, current_ns - window_ns, 0, hi)
+            calls_in_window = len(timestamps) - hi
+            rates[window] = calls_in_window * rate_factor
 
         return rates
 
     def track_call_timestamp(
         self,
-        stats_state: Optional[Dict[str, Any]],
-        timestamp: float
+        stats_state: Dict[str, Any],
+        timestamp: int
     ) -> Dict[str, Any]:
-        """Return updated statistics state with new timestamp.
+        """Add a call timestamp to the statistics state in place and return it.
 
         Maintains a sliding window of timestamps, removing old entries to prevent
-        unbounded memory growth.
+        unbounded memory growth. Timestamps are kept sorted so expired entries are
+        always a prefix of the list and can be dropped with a single slice deletion.
 
         Args:
-            stats_state: Statistics state dict or None if uninitialized
-            timestamp: Monotonic timestamp from time.perf_counter()
+            stats_state: Statistics state dict from new_state() to update
+            timestamp: Monotonic timestamp from time.perf_counter_ns()
 
         Returns:
-            Updated statistics state dict
+            The updated statistics state dict
         """
-        if stats_state is None:
-            stats_state = {"call_timestamps": []}
-
-        # Work with copy to avoid mutation
-        state = dict(stats_state)
-        timestamps = list(state.get("call_timestamps", []))
+        timestamps = stats_state["call_timestamps"]
 
-        # Add timestamp
-        timestamps.append(timestamp)
+        # Calls from other workers may finish out of order, so insert in place
+        bisect.insort(timestamps, timestamp)
 
         # Remove timestamps older than the largest window
-        if self.rate_windows:
-            max_window = max(self.rate_windows)
-            cutoff_time = timestamp - max_window
-            # Keep only recent timestamps
-            timestamps = [ts for ts in timestamps if ts >= cutoff_time]
+        if self._max_window_ns is not None:
+            cutoff_ns = timestamp - self._max_window_ns
+            del timestamps[:bisect.bisect_left(timestamps, cutoff_ns)]
+
+        return stats_state
+
+    def track_call_timestamps(
+        self,
+        stats_state: Dict[str, Any],
+        timestamps: List[int]
+    ) -> Dict[str, Any]:
+        """Add a batch of call timestamps to the statistics state in place and return it.
+
+        Equivalent to calling track_call_timestamp() for each timestamp, but the
+        batch is merged with a single sort and expired entries are dropped once.
+
+        Args:
+            stats_state: Statistics state dict from new_state() to update
+            timestamps: Monotonic timestamps from time.perf_counter_ns()
+
+        Returns:
+            The updated statistics state dict
+        """
+        if not timestamps:
+            return stats_state
+
+        # The stored list is sorted and the batch nearly so, which sort() merges in linear time
+        call_timestamps = stats_state["call_timestamps"]
+        call_timestamps.extend(timestamps)
+        call_timestamps.sort()
+
+        if self._max_window_ns is not None:
+            cutoff_ns = max(timestamps) - self._max_window_ns
+            del call_timestamps[:bisect.bisect_left(call_timestamps, cutoff_ns)]
+
+        return stats_state
 
-        state["call_timestamps"] = timestamps
-        return state
+    def _read_digest(self, stats_state: Dict[str, Any], key: str) -> Optional[TDigest]:
+        """Build a digest from state that includes the samples still buffered.
+
+        The result is reused while neither the stored digest nor its buffer has
+        changed, so repeated reads of an unchanged state deserialize it only once.
+
+        Args:
+            stats_state: Statistics state dict
+            key: Key of the serialized digest (e.g. "duration_digest")
+
+        Returns:
+            TDigest instance or None if no samples were recorded under key
+        """
+        buffer = stats_state.get(f"{key}_buffer") or []
+        signature = (stats_state.get(f"{key}_version", 0), len(buffer))
+        cached = self._read_digests.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        if key in stats_state:
+            digest: Optional[TDigest] = _blob_to_digest(stats_state[key])
+        elif buffer:
+            digest = TDigest(max_centroids=DIGEST_MAX_CENTROIDS)
+        else:
+            digest = None
+        if digest is not None and buffer:
+            digest.batch_update(sorted(buffer))
+        self._read_digests[key] = (signature, digest)
+        return digest
+
+    def snapshot_for_event(
+        self,
+        stats_state: Optional[Dict[str, Any]],
+        min_samples: int = 10
+    ) -> Tuple[Optional[TDigest], Optional[TDigest], int]:
+        """Extract everything a periodic check event needs from the statistics state.
+
+        Args:
+            stats_state: Statistics state dict or None if uninitialized
+            min_samples: Minimum number of samples required to return the digests
+
+        Returns:
+            Tuple of (duration digest, wait digest, sample count); the digests are
+            None if there are fewer than min_samples samples
+        """
+        sample_count = self.get_sample_count(stats_state)
+        if stats_state is None or sample_count < min_samples:
+            return None, None, sample_count
+        return (
+            self._read_digest(stats_state, "duration_digest"),
+            self._read_digest(stats_state, "wait_digest"),
+            sample_count,
+        )
 
     def get_duration_digest(
         self,
@@ -174,6 +358,9 @@ class PacerMetrics:
     ) -> Optional[TDigest]:
         """Extract duration digest from statistics state if sufficient samples exist.
 
+        Until the first DIGEST_FLUSH_THRESHOLD samples have been flushed, the digest
+        is built from the raw buffered samples alone, so early percentiles are exact.
+
         Args:
             stats_state: Statistics state dict or None if uninitialized
             min_samples: Minimum number of samples required to return digest
@@ -184,9 +371,8 @@ class PacerMetrics:
         if stats_state is None:
             return None
 
-        sample_count = stats_state.get("sample_count", 0)
-        if "duration_digest" in stats_state and sample_count >= min_samples:
-            return TDigest.from_dict(stats_state["duration_digest"])
+        if stats_state.get("sample_count", 0) >= min_samples:
+            return self._read_digest(stats_state, "duration_digest")
         return None
 
     def get_wait_digest(
@@ -196,6 +382,9 @@ class PacerMetrics:
     ) -> Optional[TDigest]:
         """Extract wait digest from statistics state if sufficient samples exist.
 
+        Until the first DIGEST_FLUSH_THRESHOLD samples have been flushed, the digest
+        is built from the raw buffered samples alone, so early percentiles are exact.
+
         Args:
             stats_state: Statistics state dict or None if uninitialized
             min_samples: Minimum number of samples required to return digest
@@ -206,9 +395,8 @@ class PacerMetrics:
         if stats_state is None:
             return None
 
-        sample_count = stats_state.get("sample_count", 0)
-        if "wait_digest" in stats_state and sample_count >= min_samples:
-            return TDigest.from_dict(stats_state["wait_digest"])
+        if stats_state.get("sample_count", 0) >= min_samples:
+            return self._read_digest(stats_state, "wait_digest")
         return None
 
     def get_sample_count(
@@ -3,17 +3,26 @@
 import pytest
 
 
-def pytest_configure(config: pytest.Config):
-    """Register the fixture modules to expose their fixtures."""
-    from . import rate_limiter_fixture, shared_json
+def pytest_addoption(parser: pytest.Parser):
+    """Register the plugin's ini options."""
+    parser.addini(
+        "limit_worker_threads",
+        type="bool",
+        default=False,
+        help="Cap BLAS/OpenMP thread pools in each xdist worker to its share of the CPUs "
+        "(requires threadpoolctl)",
+    )
 
-    if not config.pluginmanager.is_registered(shared_json):
-        config.pluginmanager.register(
-            shared_json, name="pytest_xdist_rate_limit_shared_json"
-        )
 
-    if not config.pluginmanager.is_registered(rate_limiter_fixture):
-        config.pluginmanager.register(
-            rate_limiter_fixture, name="pytest_xdist_rate_limit_rate_limiter"
-        )
+def pytest_configure(config: pytest.Config):
+    """Register the fixture modules to expose their fixtures."""
+    from . import rate_limiter_fixture, shared_json, worker_threads
 
+    plugins = (
+        (shared_json, "pytest_xdist_rate_limit_shared_json"),
+        (rate_limiter_fixture, "pytest_xdist_rate_limit_rate_limiter"),
+        (worker_threads, "pytest_xdist_rate_limit_worker_threads"),
+    )
+    for module, name in plugins:
+        if not config.pluginmanager.is_registered(module):
+            config.pluginmanager.register(module, name=name)
@@ -6,8 +6,21 @@ factory methods for different time units.
 """
 from __future__ import annotations
 
+import math
+from functools import lru_cache
 from typing import Union
 
+SECONDS_PER_HOUR = 3600
+MINUTES_PER_HOUR = 60
+HOURS_PER_DAY = 24
+# Decimal places kept before flooring, enough to absorb float noise in the conversions
+FLOAT_NOISE_DIGITS = 6
+
+
+def _whole_calls_per_hour(calls_per_hour: float) -> int:
+    """Round a converted rate down to whole calls per hour, ignoring float noise."""
+    return math.floor(round(calls_per_hour, FLOAT_NOISE_DIGITS))
+
 
 class Rate:
     """
@@ -18,8 +31,16 @@ class Rate:
         >>> rate = Rate.per_minute(600)  # 600 calls per minute
         >>> rate = Rate.per_hour(3600)  # 3600 calls per hour
         >>> rate = Rate.per_day(86400)  # 86400 calls per day
+
+    Rates are immutable, compare by value, and the factory methods return a
+    shared instance for repeated arguments. Factory results are rounded down to
+    whole calls per hour, so a rate never exceeds the one asked for (``per_day(36)``
+    is 1 call per hour). Float noise such as ``0.29 * 3600`` being
+    1043.9999999999998 is ignored, so that rate is 1044 calls per hour.
     """
 
+    __slots__ = ("_calls_per_hour",)
+
     def __init__(self, calls_per_hour: int):
         if calls_per_hour <= 0:
             raise ValueError("calls_per_hour must be positive")
@@ -30,20 +51,32 @@ class Rate:
         return self._calls_per_hour
 
     @classmethod
+    @lru_cache(maxsize=128)
     def per_second(cls, calls: Union[int, float]) -> Rate:
-        return cls(int(calls * 3600))
+        return cls(_whole_calls_per_hour(calls * SECONDS_PER_HOUR))
 
     @classmethod
+    @lru_cache(maxsize=128)
     def per_minute(cls, calls: Union[int, float]) -> Rate:
-        return cls(int(calls * 60))
+        return cls(_whole_calls_per_hour(calls * MINUTES_PER_HOUR))
 
     @classmethod
+    @lru_cache(maxsize=128)
     def per_hour(cls, calls: int) -> Rate:
         return cls(calls)
 
     @classmethod
+    @lru_cache(maxsize=128)
     def per_day(cls, calls: Union[int, float]) -> Rate:
-        return cls(int(calls / 24))
+        return cls(_whole_calls_per_hour(calls / HOURS_PER_DAY))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rate):
+            return NotImplemented
+        return self._calls_per_hour == other._calls_per_hour
+
+    def __hash__(self) -> int:
+        return hash(self._calls_per_hour)
 
     def __repr__(self) -> str:
         return f"Rate({self._calls_per_hour} calls/hour)"
@@ -4,6 +4,7 @@ This module provides fixtures for creating pacers that share state
 across multiple pytest-xdist workers.
 """
 
+import warnings
 from typing import Callable, Optional, Union
 
 import pytest
@@ -14,13 +15,20 @@ from pytest_xdist_rate_limit.events import (
     PeriodicCheckEvent,
 )
 from pytest_xdist_rate_limit.rate import Rate
-from pytest_xdist_rate_limit.token_bucket_rate_limiter import TokenBucketPacer
+from pytest_xdist_rate_limit.token_bucket_rate_limiter import (
+    PACER_STATE_LAYOUT,
+    TokenBucketPacer,
+)
 
 # Type aliases for callback signatures
 DriftCallback = Callable[[DriftEvent], None]
 MaxCallsCallback = Callable[[MaxCallsEvent], None]
 PeriodicCheckCallback = Callable[[PeriodicCheckEvent], None]
 
+# Reserved prefix for the shared record holding a pacer's per-call counters;
+# pacer names may not start with it, so a counter record never clashes with a pacer
+COUNTER_STATE_PREFIX = "__pacer_counters__"
+
 
 @pytest.fixture(scope="session")
 def make_pacer(make_shared_json):
@@ -29,6 +37,11 @@ def make_pacer(make_shared_json):
     This fixture provides a way to create TokenBucketPacer instances
     that share state across workers using SharedJson.
 
+    Each pacer uses two shared records: ``pacer.shared_state`` holds the
+    statistics (e.g. ``rate_stats``), while the call count, exception count,
+    start time and token bucket live in ``pacer.counter_state``, stored under
+    the reserved name ``COUNTER_STATE_PREFIX + name``.
+
     Example:
         @pytest.fixture(scope="session")
         def pacer(make_pacer):
@@ -44,6 +57,7 @@ def make_pacer(make_shared_json):
                 # Entering the context will wait if required to respect the rate
                 pass
     """
+    pacers = []
 
     def factory(
         name: str,
@@ -56,11 +70,13 @@ def make_pacer(make_shared_json):
         max_calls: int = -1,
         on_max_calls_callback: Optional[MaxCallsCallback] = None,
         on_periodic_check_callback: Optional[PeriodicCheckCallback] = None,
+        reservation_size: int = 1,
+        adaptive_drift_checks: bool = False,
     ) -> TokenBucketPacer:
         """Create a TokenBucketPacer instance with shared state.
 
         Args:
-            name: Unique name for this pacer
+            name: Unique name for this pacer (must not start with COUNTER_STATE_PREFIX)
             hourly_rate: Target rate (Rate object or callable returning one)
             max_drift: Maximum allowed drift from expected rate (0-1)
             on_drift_callback: Callback when drift exceeds max_drift
@@ -70,17 +86,28 @@ def make_pacer(make_shared_json):
             max_calls: Maximum number of calls allowed (-1 for unlimited)
             on_max_calls_callback: Callback when max_calls is reached
             on_periodic_check_callback: Callback for periodic metrics checks
+            reservation_size: Token slots reserved per trip to shared state (default: 1)
+            adaptive_drift_checks: Check drift less often while it stays small (default: False)
 
         Returns:
             TokenBucketPacer: Pacer instance with shared state across workers
 
+        Raises:
+            ValueError: If name starts with the reserved COUNTER_STATE_PREFIX
+
         Note:
             For detailed parameter documentation, see TokenBucketPacer.__init__
         """
+        if name.startswith(COUNTER_STATE_PREFIX):
+            raise ValueError(f"Pacer name must not start with reserved prefix {COUNTER_STATE_PREFIX!r}, got {name!r}")
+
         shared_state = make_shared_json(name=name)
+        # Per-call fields live in a fixed-layout record to keep JSON off the hot path
+        counter_state = make_shared_json(name=f"{COUNTER_STATE_PREFIX}{name}", layout=PACER_STATE_LAYOUT)
 
-        return TokenBucketPacer(
+        pacer = TokenBucketPacer(
             shared_state=shared_state,
+            counter_state=counter_state,
             hourly_rate=hourly_rate,
             max_drift=max_drift,
             on_drift_callback=on_drift_callback,
@@ -90,9 +117,18 @@ def make_pacer(make_shared_json):
             max_calls=max_calls,
             on_max_calls_callback=on_max_calls_callback,
             on_periodic_check_callback=on_periodic_check_callback,
+            reservation_size=reservation_size,
+            adaptive_drift_checks=adaptive_drift_checks,
         )
+        pacers.append(pacer)
+        return pacer
+
+    yield factory
 
-    return factory
+    # Hand unused reserved slots and buffered counts back before make_shared_json tears down
+    for pacer in pacers:
+        pacer.release_reserved_slots()
+        pacer.flush()
 
 
 @pytest.fixture(scope="session")
@@ -103,7 +139,6 @@ def make_rate_limiter(make_pacer):
     This fixture is deprecated and will be removed in a future version.
     Please use make_pacer instead.
     """
-    import warnings
     warnings.warn(
         "make_rate_limiter is deprecated, use make_pacer instead",
         DeprecationWarning,
@@ -8,6 +8,7 @@ including drift detection, periodic metrics callbacks, and max calls monitoring.
 from __future__ import annotations
 
 import logging
+import math
 import os
 import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 # Constants
 SECONDS_PER_HOUR = 3600
+MAX_DRIFT_CHECK_STRIDE = 64  # max checkpoints between drift checks when adaptive
 
 
 class RateMonitor:
@@ -37,6 +39,7 @@ class RateMonitor:
         on_drift_callback: Callback function to execute when drift exceeds max_drift
         on_periodic_check_callback: Callback function for periodic metrics checks
         on_max_calls_callback: Callback function to execute when max_calls is reached
+        adaptive_drift_checks: Whether the drift check cadence adapts to the observed drift
     """
 
     def __init__(
@@ -46,6 +49,7 @@ class RateMonitor:
         on_drift_callback: Optional[Callable[[DriftEvent], None]] = None,
         on_periodic_check_callback: Optional[Callable[[PeriodicCheckEvent], None]] = None,
         on_max_calls_callback: Optional[Callable[[MaxCallsEvent], None]] = None,
+        adaptive_drift_checks: bool = False,
     ):
         """
         Initialize the rate monitor.
@@ -56,19 +60,68 @@ class RateMonitor:
             on_drift_callback: Callback function to execute when drift exceeds max_drift
             on_periodic_check_callback: Callback function for periodic metrics checks
             on_max_calls_callback: Callback function to execute when max_calls is reached
+            adaptive_drift_checks: If True, drift checks are spread out while drift stays
+                                   small. The number of checkpoints between drift checks
+                                   doubles (up to MAX_DRIFT_CHECK_STRIDE) while
+                                   drift stays below max_drift/4 and halves when it exceeds
+                                   max_drift/2. Periodic and max_calls checks are unaffected.
         """
         self.max_drift = max_drift
         self.seconds_before_first_check = seconds_before_first_check
         self.on_drift_callback = on_drift_callback
         self.on_periodic_check_callback = on_periodic_check_callback
         self.on_max_calls_callback = on_max_calls_callback
+        self.adaptive_drift_checks = adaptive_drift_checks
+        self._drift_check_stride = 1
+        self._checkpoints_until_drift_check = 0
+        # Read per monitor rather than per process: the count is fixed within a
+        # session, but a process may run several sessions (e.g. under pytester)
+        self._worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+    def on_checkpoint(
+        self,
+        state: Dict[str, Any],
+        stats_state: Dict[str, Any],
+        limiter_id: str,
+        target_rate: float,
+        limiter: TokenBucketPacer,
+        metrics: PacerMetrics,
+        max_calls: int
+    ) -> None:
+        """Run the drift, periodic and max_calls checks for one checkpoint.
+
+        The clock is read once and the elapsed time shared by all checks.
+
+        Args:
+            state: Per-call state snapshot
+            stats_state: Statistics state dictionary
+            limiter_id: Identifier for the rate limiter
+            target_rate: Target rate in calls per hour
+            limiter: Reference to the TokenBucketPacer instance
+            metrics: Metrics tracker instance for windowed rates
+            max_calls: Maximum number of calls allowed (-1 for unlimited)
+        """
+        elapsed_time = time.time() - state["start_time"]
+        self.check_rate(state, limiter_id, target_rate, limiter, elapsed_time=elapsed_time)
+        self.periodic_check(
+            state, stats_state, limiter_id, target_rate, limiter, metrics, elapsed_time=elapsed_time
+        )
+        if max_calls > 0 and state["call_count"] >= max_calls:
+            self.check_max_calls(
+                call_count=state["call_count"],
+                max_calls=max_calls,
+                state_snapshot=state,
+                limiter_id=limiter_id,
+                limiter=limiter
+            )
 
     def check_rate(
         self,
         state: Dict[str, Any],
         limiter_id: str,
         target_rate: float,
-        limiter: TokenBucketPacer
+        limiter: TokenBucketPacer,
+        elapsed_time: Optional[float] = None
     ) -> None:
         """Check if the current rate is within acceptable limits.
 
@@ -77,9 +130,14 @@ class RateMonitor:
             limiter_id: Identifier for the rate limiter
             target_rate: Target rate in calls per hour
             limiter: Reference to the TokenBucketPacer instance
+            elapsed_time: Seconds since start_time, read from the clock if None
         """
-        current_time = time.time()
-        elapsed_time = current_time - state["start_time"]
+        if self._checkpoints_until_drift_check > 0:
+            self._checkpoints_until_drift_check -= 1
+            return
+
+        if elapsed_time is None:
+            elapsed_time = time.time() - state["start_time"]
 
         # Only check if we have enough data
         if elapsed_time < self.seconds_before_first_check:
@@ -87,6 +145,8 @@ class RateMonitor:
 
         current_rate = self._calculate_current_rate(state["call_count"], elapsed_time)
         drift = self._calculate_drift(current_rate, target_rate)
+        if self.adaptive_drift_checks:
+            self._adapt_drift_check_stride(drift)
 
         self._log_rate_check(limiter_id, current_rate, target_rate, drift, state)
 
@@ -95,6 +155,18 @@ class RateMonitor:
                 limiter_id, current_rate, target_rate, drift, state, limiter
             )
 
+    def _adapt_drift_check_stride(self, drift: float) -> None:
+        """Widen the drift check stride while drift is small, narrow it as drift grows.
+
+        Args:
+            drift: Drift fraction measured by the current check
+        """
+        if drift < self.max_drift / 4:
+            self._drift_check_stride = min(self._drift_check_stride * 2, MAX_DRIFT_CHECK_STRIDE)
+        elif drift > self.max_drift / 2:
+            self._drift_check_stride = max(self._drift_check_stride // 2, 1)
+        self._checkpoints_until_drift_check = self._drift_check_stride - 1
+
     def _calculate_current_rate(self, call_count: int, elapsed_time: float) -> float:
         """Calculate current rate in calls per hour.
 
@@ -112,14 +184,13 @@ class RateMonitor:
 
         Args:
             current_rate: Current rate in calls per hour
-            target_rate: Target rate in calls per hour
+            target_rate: Target rate in calls per hour, always positive since
+                         Rate rejects non-positive values
 
         Returns:
             Drift as a fraction (0.0 to inf)
         """
-        if target_rate > 0:
-            return abs(current_rate - target_rate) / target_rate
-        return 0 if current_rate == 0 else float("inf")
+        return math.fabs(current_rate - target_rate) / target_rate
 
     def _log_rate_check(
         self,
@@ -138,6 +209,8 @@ class RateMonitor:
             drift: Calculated drift fraction
             state: Shared state dictionary
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(
             f"Rate check for {limiter_id}: current={current_rate:.2f}/hr, "
             f"target={target_rate}/hr, drift={drift:.2%}. "
@@ -160,7 +233,7 @@ class RateMonitor:
             current_rate: Current rate in calls per hour
             target_rate: Target rate in calls per hour
             drift: Calculated drift fraction
-            state: Shared state dictionary
+            state: Per-call state snapshot, passed to the event without copying
             limiter: Reference to the TokenBucketPacer instance
         """
         message = (
@@ -174,7 +247,7 @@ class RateMonitor:
             event = DriftEvent(
                 limiter_id=limiter_id,
                 limiter=limiter,
-                state_snapshot=dict(state),
+                state_snapshot=state,
                 current_rate=current_rate,
                 target_rate=target_rate,
                 drift=drift,
@@ -189,7 +262,8 @@ class RateMonitor:
         limiter_id: str,
         target_rate: float,
         limiter: TokenBucketPacer,
-        metrics: PacerMetrics
+        metrics: PacerMetrics,
+        elapsed_time: Optional[float] = None
     ) -> None:
         """Perform periodic check and invoke callback with current metrics.
 
@@ -198,32 +272,30 @@ class RateMonitor:
         for bottleneck analysis.
 
         Args:
-            state: Shared state dictionary
+            state: Per-call state snapshot, passed to the event without copying
             stats_state: Statistics state dictionary
             limiter_id: Identifier for the rate limiter
             target_rate: Target rate in calls per hour
             limiter: Reference to the TokenBucketPacer instance
             metrics: Metrics tracker instance for windowed rates
+            elapsed_time: Seconds since start_time, read from the clock if None
         """
         if not self.on_periodic_check_callback:
             return
 
-        worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1))
-
         # Delegate statistics extraction to PacerMetrics
-        sample_count = metrics.get_sample_count(stats_state)
-        duration_digest = metrics.get_duration_digest(stats_state, min_samples=10)
-        wait_digest = metrics.get_wait_digest(stats_state, min_samples=10)
+        duration_digest, wait_digest, sample_count = metrics.snapshot_for_event(
+            stats_state, min_samples=10
+        )
         windowed_rates = metrics.calculate_windowed_rates(stats_state)
 
-        current_time = time.time()
-        elapsed = current_time - state["start_time"]
+        elapsed = elapsed_time if elapsed_time is not None else time.time() - state["start_time"]
         if elapsed > 0:
             current_rate = self._calculate_current_rate(state["call_count"], elapsed)
         else:
             current_rate = 0
 
-        if elapsed >= self.seconds_before_first_check and target_rate > 0:
+        if elapsed >= self.seconds_before_first_check:
             drift = self._calculate_drift(current_rate, target_rate)
         else:
             drift = None
@@ -231,8 +303,8 @@ class RateMonitor:
         event = PeriodicCheckEvent(
             limiter_id=limiter_id,
             limiter=limiter,
-            state_snapshot=dict(state),
-            worker_count=worker_count,
+            state_snapshot=state,
+            worker_count=self._worker_count,
             duration_digest=duration_digest,
             wait_digest=wait_digest,
             windowed_rates=windowed_rates,
@@ -241,7 +313,8 @@ class RateMonitor:
             current_rate=current_rate,
             drift=drift,
         )
-        logger.debug(str(event))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", event)
         self.on_periodic_check_callback(event)
 
     def check_max_calls(
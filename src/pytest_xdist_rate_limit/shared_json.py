@@ -5,20 +5,131 @@ across multiple pytest-xdist workers using file-based JSON storage with FileLock
 for synchronization.
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import os
+import shutil
+import time
+import uuid
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, Optional, Set, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Mapping, Optional, Set, Tuple, Union
 
 import pytest
 from filelock import FileLock
 
+if TYPE_CHECKING:
+    from pytest_xdist_rate_limit.shared_struct import SharedStruct, StructLayout
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    _loads = json.loads
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+
 # Constants
-INIT_LOCK_TIMEOUT = 30  # seconds for initialization lock acquisition
+INIT_TIMEOUT = 30  # seconds to wait for the first worker to initialize shared data
+INIT_POLL_INTERVAL = 0.01  # seconds between checks while waiting for initialization
+MARKER_WRITE_GRACE = 1.0  # seconds an init marker may stay empty before it counts as abandoned
 SHARED_FILE_PREFIX = "pytest_shared_"  # prefix for shared fixture files
+# Files modified this recently are not cached by read(): a same-size rewrite within
+# the filesystem's timestamp granularity would otherwise go unnoticed.
+RACY_WINDOW_NS = 1_000_000_000
+
+
+def _parse_json(raw: bytes) -> Dict[str, Any]:
+    """Parse the contents of a JSON data file (an empty file reads as {})."""
+    return _loads(raw) if raw.strip() else {}
+
+
+def _read_json(data_file: Path) -> Dict[str, Any]:
+    """Parse a JSON data file (an empty file reads as {})."""
+    with open(data_file, "rb") as f:
+        return _parse_json(f.read())
+
+
+def _write_json(data_file: Path, data: Dict[str, Any]) -> None:
+    """Write data to a temporary file and atomically move it over data_file."""
+    tmp_file = data_file.with_suffix(f"{data_file.suffix}.{os.getpid()}.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(_dumps(data))
+    os.replace(tmp_file, data_file)
+
+
+def _process_is_alive(pid: int) -> bool:
+    """Check whether a process with this pid exists on this host.
+
+    Processes that cannot be probed (no signal 0 on Windows) are assumed alive,
+    so a crashed owner there is only noticed through the init timeout.
+    """
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _init_marker_status(init_marker: Path, data_file: Path, session_uid: str) -> Optional[str]:
+    """Classify an init marker left by _initialize_first_worker_data.
+
+    The worker that creates the marker writes the test run's uid and its pid on
+    the first line right away, and a "ready" line once the shared data is written.
+
+    Args:
+        init_marker: Path of the init marker
+        data_file: Path of the data file the marker guards
+        session_uid: Uid of the current test run
+
+    Returns:
+        None if there is no marker, "ready" once the data is initialized,
+        "pending" while a live worker is initializing it, or "stale" if the
+        marker was abandoned (empty for longer than MARKER_WRITE_GRACE, its
+        owner is no longer running, or it is ready but its data file is gone or
+        was written by an earlier run whose owner has exited)
+    """
+    try:
+        content = init_marker.read_text()
+        modified = init_marker.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    owner, newline, status = content.partition("\n")
+    if not newline:
+        # Only a crash right after the exclusive create leaves a marker without an owner
+        return "stale" if time.time() - modified > MARKER_WRITE_GRACE else "pending"
+    owner_uid, _, owner_pid = owner.partition(" ")
+    try:
+        owner_alive = _process_is_alive(int(owner_pid))
+    except ValueError:
+        return "stale"
+    if status.startswith("ready"):
+        # The owner of a ready marker may legitimately exit before other workers
+        # start, so only markers from another run need a live owner
+        if (owner_uid == session_uid or owner_alive) and data_file.exists():
+            return "ready"
+        return "stale"
+    return "pending" if owner_alive else "stale"
 
 
 class SharedJson:
@@ -26,6 +137,8 @@ class SharedJson:
 
     This class provides atomic operations on a JSON file, ensuring data
     consistency when multiple workers access the same data concurrently.
+    Writes go to a temporary file that atomically replaces the data file, so
+    the file always holds a complete JSON document.
 
     All data must be JSON-serializable (dict, list, str, int, float, bool, None).
     For timestamps, use time.time() instead of datetime objects.
@@ -51,6 +164,10 @@ class SharedJson:
         self.lock_file = lock_file
         self.timeout = timeout
         self._lock = FileLock(str(lock_file), timeout=timeout)
+        # Raw file contents, plus their parsed form once read_view() needs it
+        self._cache_raw = b""
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[tuple] = None
 
     @property
     def name(self) -> str:
@@ -89,20 +206,48 @@ class SharedJson:
             values can be stored (no datetime, custom objects, etc.).
         """
         with self._lock:
-            if self.data_file.exists():
-                with open(self.data_file, "r") as f:
-                    data = json.load(f)
-            else:
+            try:
+                data = _read_json(self.data_file)
+            except FileNotFoundError:
                 data = {}
 
             yield data
 
-            with open(self.data_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._cache_key = None
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_json(self.data_file, data)
+
+    def _read_raw(self) -> Tuple[bytes, bool]:
+        """Return the current file contents and whether they are the cached ones.
+
+        Must be called with the lock held. The contents are cached in-process
+        and keyed by the file's inode, modification time and size.
+        """
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            return b"", False
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key == self._cache_key:
+            return self._cache_raw, True
+
+        with open(self.data_file, "rb") as f:
+            raw = f.read()
+
+        if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+            self._cache_raw, self._cache, self._cache_key = raw, None, key
+            return raw, True
+        return raw, False
 
     def read(self) -> Dict[str, Any]:
         """Read the current data atomically (read-only snapshot).
 
+        The file contents are cached in-process and keyed by the file's inode,
+        modification time and size, so polling an unchanged file skips the
+        open. Every call parses a fresh dict, which is cheaper than deep-copying
+        a cached one; use read_view() to also skip the parse.
+
         Returns:
             dict: A copy of the current data from the JSON file
 
@@ -114,10 +259,33 @@ class SharedJson:
             count = data.get('count', 0)
         """
         with self._lock:
-            if self.data_file.exists():
-                with open(self.data_file, "r") as f:
-                    return json.load(f)
-            return {}
+            raw, _ = self._read_raw()
+            return _parse_json(raw)
+
+    def read_view(self) -> Mapping[str, Any]:
+        """Read the current data atomically as a read-only view.
+
+        Unlike read(), which parses a fresh dict on every call, the view wraps
+        data parsed once per change of the file, so repeated polling of an
+        unchanged file allocates nothing. The view is read-only at the top
+        level only; nested values must not be mutated.
+
+        Returns:
+            Mapping[str, Any]: A read-only view of the current data
+
+        Raises:
+            filelock.Timeout: If lock cannot be acquired within timeout period
+
+        Example:
+            total = shared.read_view().get('total_workers', 0)
+        """
+        with self._lock:
+            raw, cached = self._read_raw()
+            if not cached:
+                return MappingProxyType(_parse_json(raw))
+            if self._cache is None:
+                self._cache = _parse_json(raw)
+            return MappingProxyType(self._cache)
 
     def update(self, updates: Dict[str, Any]) -> None:
         """Update specific keys atomically.
@@ -134,6 +302,70 @@ class SharedJson:
         with self.locked_dict() as data:
             data.update(updates)
 
+    def wait_for(
+        self,
+        predicate: Callable[[Mapping[str, Any]], bool],
+        timeout: float,
+        initial_interval: float = 0.01,
+        max_interval: float = 0.5,
+    ) -> bool:
+        """Block until predicate(data) is true or timeout expires.
+
+        Between checks the data file is only stat-ed, without taking the lock;
+        the data is re-read and the predicate re-evaluated when the file has
+        changed. The polling interval doubles from initial_interval up to
+        max_interval while nothing changes, and drops back after a change.
+
+        Args:
+            predicate: Function receiving a read-only view of the data (see read_view)
+            timeout: Maximum time to wait in seconds
+            initial_interval: First polling interval in seconds
+            max_interval: Upper bound for the polling interval in seconds
+
+        Returns:
+            bool: True if the predicate was satisfied, False on timeout
+
+        Raises:
+            filelock.Timeout: If lock cannot be acquired within timeout period
+
+        Example:
+            shared.wait_for(lambda data: data.get('ready_workers', 0) >= 4, timeout=30)
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial_interval
+        last_key: Any = object()  # never equal to a stat key, so the first pass reads
+        while True:
+            try:
+                stat = os.stat(self.data_file)
+                key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                settled = time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS
+            except FileNotFoundError:
+                key, settled = None, True
+
+            if key != last_key or not settled:
+                if predicate(self.read_view()):
+                    return True
+                if key != last_key:
+                    interval = initial_interval
+                last_key = key
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+
+    def debug_dump(self) -> str:
+        """Return the current data as indented JSON, for logs and debugging.
+
+        The data file itself is written compactly; use this when a readable
+        rendering is needed.
+
+        Returns:
+            str: The current data, pretty-printed
+        """
+        return json.dumps(self.read(), indent=2, sort_keys=True)
+
 
 @pytest.fixture(scope="session")
 def make_shared_json(
@@ -179,31 +411,82 @@ def make_shared_json(
                 data['count'] = data.get('count', 0) + 1
     """
     shared_temp = tmp_path_factory.getbasetemp().parent
+    # Identifies this test run in init and teardown markers. xdist workers share
+    # the controller's uid (their shared_temp is already unique to the run); a
+    # session without xdist gets its own, as its shared_temp outlives it.
+    workerinput = getattr(request.config, "workerinput", None)
+    if workerinput is not None:
+        session_uid = workerinput.get("testrunuid") or "xdist"
+    else:
+        session_uid = uuid.uuid4().hex
     last_worker_callbacks = []
     created_files: Set[Path] = set()
+    mapped_records: List[SharedStruct] = []
 
     def _initialize_first_worker_data(
         on_first_worker: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
         init_marker: Path,
-        data_file: Path,
+        init_lock_file: Path,
+        shared: Union[SharedJson, SharedStruct],
     ) -> None:
-        is_first = not init_marker.exists()
-        if is_first:
-            init_marker.parent.mkdir(parents=True, exist_ok=True)
-            init_marker.touch()
-
-            if isinstance(on_first_worker, dict):
-                initial_data = on_first_worker
-            elif callable(on_first_worker):
-                initial_data = on_first_worker()
-                if not isinstance(initial_data, dict):
-                    raise TypeError(
-                        f"on_first_worker callback must return a dict, got {type(initial_data)}"
+        # The worker whose O_EXCL create of the marker succeeds initializes the
+        # data and then marks it ready; the others wait for that. Once
+        # initialized, later calls cost a read of the marker and a stat of the data file.
+        # A marker abandoned by a crashed worker (or left by an earlier run) is
+        # removed under the init lock: only lock holders delete a marker they did
+        # not create, so one found stale there cannot be replaced before the unlink.
+        deadline = time.monotonic() + INIT_TIMEOUT
+        while True:
+            status = _init_marker_status(init_marker, shared.data_file, session_uid)
+            if status == "ready":
+                return
+            if status == "stale":
+                with FileLock(str(init_lock_file), timeout=INIT_TIMEOUT):
+                    if _init_marker_status(init_marker, shared.data_file, session_uid) == "stale":
+                        logger.warning(f"Removing abandoned init marker {init_marker}")
+                        init_marker.unlink(missing_ok=True)
+                continue
+            if status == "pending":
+                if time.monotonic() > deadline:
+                    raise TimeoutError(
+                        f"Timed out after {INIT_TIMEOUT}s waiting for {init_marker} to be initialized"
                     )
+                time.sleep(INIT_POLL_INTERVAL)
+                continue
+
+            try:
+                fd = os.open(str(init_marker), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileNotFoundError:
+                init_marker.parent.mkdir(parents=True, exist_ok=True)
+                continue
+            except FileExistsError:
+                continue
 
-            data_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(data_file, "w") as f:
-                json.dump(initial_data, f, indent=2)
+            try:
+                os.write(fd, f"{session_uid} {os.getpid()}\n".encode())
+                if isinstance(on_first_worker, dict):
+                    initial_data = on_first_worker
+                elif callable(on_first_worker):
+                    initial_data = on_first_worker()
+                    if not isinstance(initial_data, dict):
+                        raise TypeError(
+                            f"on_first_worker callback must return a dict, got {type(initial_data)}"
+                        )
+
+                if isinstance(shared, SharedJson):
+                    shared.data_file.parent.mkdir(parents=True, exist_ok=True)
+                    _write_json(shared.data_file, initial_data)
+                else:
+                    shared.update(initial_data)
+
+                os.write(fd, b"ready\n")
+            except BaseException:
+                os.close(fd)
+                with FileLock(str(init_lock_file), timeout=INIT_TIMEOUT):
+                    init_marker.unlink(missing_ok=True)
+                raise
+            os.close(fd)
+            return
 
     def factory(
         name: str,
@@ -212,7 +495,8 @@ def make_shared_json(
         ] = None,
         on_last_worker: Optional[Callable[[SharedJson], None]] = None,
         timeout: float = -1,
-    ) -> SharedJson:
+        layout: Optional[StructLayout] = None,
+    ) -> Union[SharedJson, SharedStruct]:
         """Create a SharedJson instance with worker coordination.
 
         Args:
@@ -224,32 +508,44 @@ def make_shared_json(
                           Receives the SharedJson instance. This runs after all workers
                           have finished their tests.
             timeout: Timeout in seconds for lock acquisition (-1 = wait forever)
+            layout: Optional fixed record layout (see SharedStruct). When given, a
+                    SharedStruct backed by a memory-mapped binary record is returned
+                    instead of a SharedJson.
 
         Returns:
             SharedJson: Instance for atomic access to shared JSON data
+                        (SharedStruct if a layout was given)
 
         Raises:
             filelock.Timeout: If lock cannot be acquired within timeout period
+            TimeoutError: If the first worker does not finish initializing the data
+                          within INIT_TIMEOUT seconds
         """
         base_path = shared_temp / f"{SHARED_FILE_PREFIX}{name}"
-        data_file = base_path.with_suffix(".json")
         init_marker = base_path.with_name(f"{name}_init.marker")
         data_lock_file = base_path.with_name(f"{name}_data.lock")
         init_lock_file = base_path.with_name(f"{name}_init.lock")
 
-        shared_json = SharedJson(data_file, data_lock_file, timeout=timeout)
+        if layout is None:
+            data_file = base_path.with_suffix(".json")
+            shared_json = SharedJson(data_file, data_lock_file, timeout=timeout)
+        else:
+            from pytest_xdist_rate_limit.shared_struct import SharedStruct
 
-        # Initialize data on first worker if needed
-        if on_first_worker is not None:
-            init_lock = FileLock(str(init_lock_file), timeout=INIT_LOCK_TIMEOUT)
-            with init_lock:
-                _initialize_first_worker_data(on_first_worker, init_marker, data_file)
+            data_file = base_path.with_suffix(".bin")
+            shared_json = SharedStruct(data_file, data_lock_file, layout, timeout=timeout)
+            mapped_records.append(shared_json)
 
+        # Registered before initializing so the marker is cleaned up even if
+        # initialization fails or times out
         created_files.add(data_file)
         created_files.add(data_lock_file)
+        created_files.add(init_marker)
         created_files.add(init_lock_file)
-        if init_marker.exists():
-            created_files.add(init_marker)
+
+        # Initialize data on first worker if needed
+        if on_first_worker is not None:
+            _initialize_first_worker_data(on_first_worker, init_marker, init_lock_file, shared_json)
 
         if on_last_worker is not None:
             last_worker_callbacks.append((shared_json, on_last_worker))
@@ -258,13 +554,13 @@ def make_shared_json(
 
     yield factory
 
-    # Teardown: Determine if this is the last worker and perform cleanup
-    # Create a SharedJson to track which workers have finished
-    teardown_tracker_path = shared_temp / "pytest_factory_teardown"
-    teardown_data_file = teardown_tracker_path.with_suffix(".json")
-    teardown_lock_file = teardown_tracker_path.with_name("teardown.lock")
-
-    teardown_tracker = SharedJson(teardown_data_file, teardown_lock_file, timeout=30)
+    # Teardown: Determine if this is the last worker and perform cleanup.
+    # Each worker drops a marker with an exclusive create; whoever then sees a
+    # marker for every worker tries to claim the cleanup, and exactly one wins.
+    # The directory is keyed on the test run, so markers left behind by a run
+    # that crashed during teardown cannot stop a later run from finishing.
+    teardown_dir = shared_temp / f"pytest_factory_teardown_{session_uid}"
+    teardown_dir.mkdir(parents=True, exist_ok=True)
 
     # Get the actual number of workers from pytest config
     # The workerinput plugin option contains worker count info
@@ -272,18 +568,19 @@ def make_shared_json(
     if total_workers is None:
         total_workers = 1
 
-    # Track this worker's teardown
-    with teardown_tracker.locked_dict() as data:
-        if "finished_workers" not in data:
-            data["finished_workers"] = []
-            data["total_workers"] = total_workers
+    try:
+        os.close(os.open(str(teardown_dir / f"{worker_id}.done"), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        pass
 
-        # Add this worker if not already tracked
-        if worker_id not in data["finished_workers"]:
-            data["finished_workers"].append(worker_id)
-
-        # Check if this is the last worker
-        is_last = len(data["finished_workers"]) >= data["total_workers"]
+    finished = sum(1 for entry in os.scandir(teardown_dir) if entry.name.endswith(".done"))
+    is_last = False
+    if finished >= total_workers:
+        try:
+            os.close(os.open(str(teardown_dir / "last.claimed"), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            is_last = True
+        except FileExistsError:
+            pass
 
     if is_last:
         for shared_json, callback in last_worker_callbacks:
@@ -292,19 +589,17 @@ def make_shared_json(
             except Exception as e:
                 logger.exception(f"Error in on_last_worker callback: {e}")
 
+    # Every worker unmaps its records; the last one does so after the callbacks
+    # and before removing the files
+    for record in mapped_records:
+        record.close()
+
+    if is_last:
         for file_path in created_files:
             try:
-                if file_path.exists():
-                    file_path.unlink()
-                    logger.debug(f"Cleaned up file: {file_path}")
+                file_path.unlink(missing_ok=True)
+                logger.debug(f"Cleaned up file: {file_path}")
             except Exception as e:
                 logger.warning(f"Failed to cleanup file {file_path}: {e}")
 
-        try:
-            if teardown_data_file.exists():
-                teardown_data_file.unlink()
-            if teardown_lock_file.exists():
-                teardown_lock_file.unlink()
-        except Exception as e:
-            logger.warning(f"Failed to cleanup teardown tracker files: {e}")
-
+        shutil.rmtree(teardown_dir, ignore_errors=True)
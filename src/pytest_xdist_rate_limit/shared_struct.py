@@ -0,0 +1,224 @@
+"""Fixed-layout shared records for pytest-xdist workers.
+
+This module provides a binary alternative to SharedJson for state whose schema
+is known up front (counters, timestamps, token bucket levels). The record lives
+in a memory-mapped file and is accessed with struct pack/unpack, so the hot path
+does no file open, JSON parsing or JSON serialization. FileLock is still used
+for cross-process mutual exclusion.
+"""
+
+import mmap
+import os
+import struct
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Mapping, Optional, Tuple, Union
+
+from filelock import FileLock
+
+from pytest_xdist_rate_limit.shared_json import SHARED_FILE_PREFIX
+
+# A layout maps top-level keys to a struct format character ("d", "q", ...)
+# or to a nested mapping of sub-keys to format characters.
+StructLayout = Mapping[str, Union[str, Mapping[str, str]]]
+
+_HEADER = struct.Struct("=Q")  # bitmask of the top-level keys that are present
+
+
+class SharedStruct:
+    """Fixed-layout binary record shared across pytest-xdist workers.
+
+    Offers the same `locked_dict()` / `read()` / `update()` interface as
+    SharedJson, but only for the keys declared in the layout. Keys start out
+    absent, so `"key" not in data` checks behave as they do with SharedJson.
+    On write, only the fields that changed are packed back into the record.
+
+    Attributes:
+        data_file: Path to the memory-mapped record file
+        lock_file: Path to the lock file for synchronization
+        layout: The record layout
+        timeout: Timeout in seconds for acquiring locks (-1 = wait forever)
+    """
+
+    def __init__(
+        self,
+        data_file: Path,
+        lock_file: Path,
+        layout: StructLayout,
+        timeout: float = -1,
+    ):
+        """Initialize the SharedStruct instance.
+
+        Args:
+            data_file: Path where the binary record will be stored
+            lock_file: Path for the lock file
+            layout: Mapping of keys to struct format characters. A value can also
+                    be a mapping of sub-keys to format characters, which is exposed
+                    as a nested dict.
+            timeout: Timeout in seconds for lock acquisition (-1 = wait forever)
+
+        Raises:
+            ValueError: If the layout has more keys than the presence mask can track
+        """
+        if len(layout) > _HEADER.size * 8:
+            raise ValueError(
+                f"layout supports at most {_HEADER.size * 8} top-level keys, got {len(layout)}"
+            )
+        self.data_file = data_file
+        self.lock_file = lock_file
+        self.layout = layout
+        self.timeout = timeout
+        self._lock = FileLock(str(lock_file), timeout=timeout)
+
+        # key -> (presence bit, [(sub_key or None, codec, offset), ...])
+        self._fields: Dict[str, Tuple[int, List[Tuple[Optional[str], struct.Struct, int]]]] = {}
+        # (key, presence bit, index of its first value in the record, sub-keys or None)
+        self._unpack_plan: List[Tuple[str, int, int, Optional[Tuple[str, ...]]]] = []
+        offset = _HEADER.size
+        value_index = 1
+        record_format = _HEADER.format
+        for index, (key, spec) in enumerate(layout.items()):
+            members = spec.items() if isinstance(spec, Mapping) else [(None, spec)]
+            codecs = []
+            for sub_key, fmt in members:
+                codec = struct.Struct(f"={fmt}")
+                codecs.append((sub_key, codec, offset))
+                offset += codec.size
+                record_format += fmt
+            self._fields[key] = (1 << index, codecs)
+            sub_keys = tuple(spec) if isinstance(spec, Mapping) else None
+            self._unpack_plan.append((key, 1 << index, value_index, sub_keys))
+            value_index += len(codecs)
+        self.size = offset
+        # The whole record, header included, so a load is a single unpack
+        self._record = struct.Struct(record_format)
+
+        self._mm = self._map_file()
+        self._finalizer = weakref.finalize(self, self._mm.close)
+
+    def _map_file(self) -> mmap.mmap:
+        """Create the record file if needed and map it into memory."""
+        fd = os.open(str(self.data_file), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < self.size:
+                os.ftruncate(fd, self.size)
+            return mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)
+
+    @property
+    def name(self) -> str:
+        """Get the name derived from the data file path.
+
+        Returns:
+            str: The stem (filename without extension) of the data file,
+                 with the pytest_shared_ prefix removed if present
+        """
+        stem = self.data_file.stem
+        if stem.startswith(SHARED_FILE_PREFIX):
+            return stem[len(SHARED_FILE_PREFIX) :]
+        return stem
+
+    def _load(self) -> Dict[str, Any]:
+        """Unpack the present keys of the record into a dict."""
+        values = self._record.unpack_from(self._mm, 0)
+        mask = values[0]
+        data: Dict[str, Any] = {}
+        for key, bit, index, sub_keys in self._unpack_plan:
+            if not mask & bit:
+                continue
+            if sub_keys is None:
+                data[key] = values[index]
+            else:
+                data[key] = dict(zip(sub_keys, values[index:index + len(sub_keys)]))
+        return data
+
+    def _store(self, data: Dict[str, Any], original: Dict[str, Any]) -> None:
+        """Pack the keys of data that differ from original back into the record."""
+        unknown = data.keys() - self._fields.keys()
+        if unknown:
+            raise KeyError(f"SharedStruct layout has no field(s) {sorted(unknown)}")
+
+        mm = self._mm
+        (mask,) = _HEADER.unpack_from(mm, 0)
+        new_mask = mask
+        for key, (bit, codecs) in self._fields.items():
+            if key not in data:
+                new_mask &= ~bit
+                continue
+            new_mask |= bit
+            value = data[key]
+            old = original.get(key)
+            if codecs[0][0] is None:
+                if key not in original or value != old:
+                    codecs[0][1].pack_into(mm, codecs[0][2], value)
+                continue
+            for sub_key, codec, offset in codecs:
+                if old is None or value[sub_key] != old.get(sub_key):
+                    codec.pack_into(mm, offset, value[sub_key])
+        if new_mask != mask:
+            _HEADER.pack_into(mm, 0, new_mask)
+
+    @contextmanager
+    def locked_dict(self) -> Generator[Dict[str, Any], None, None]:
+        """Context manager for atomic read-modify-write operations.
+
+        Yields a dict holding the present keys of the record. Changes are packed
+        back into the record when the context exits.
+
+        Yields:
+            Dict[str, Any]: The current record (modifiable)
+
+        Raises:
+            filelock.Timeout: If lock cannot be acquired within timeout period
+            KeyError: If a key that is not part of the layout was added
+
+        Example:
+            with shared.locked_dict() as data:
+                data['call_count'] = data.get('call_count', 0) + 1
+        """
+        with self._lock:
+            data = self._load()
+            original = {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in data.items()
+            }
+
+            yield data
+
+            self._store(data, original)
+
+    def read(self) -> Dict[str, Any]:
+        """Read the current record atomically (read-only snapshot).
+
+        Returns:
+            dict: A copy of the present keys of the record
+
+        Raises:
+            filelock.Timeout: If lock cannot be acquired within timeout period
+        """
+        with self._lock:
+            return self._load()
+
+    def update(self, updates: Dict[str, Any]) -> None:
+        """Update specific keys atomically.
+
+        Args:
+            updates: Dictionary of key-value pairs to update
+
+        Raises:
+            filelock.Timeout: If lock cannot be acquired within timeout period
+            KeyError: If a key is not part of the layout
+        """
+        with self.locked_dict() as data:
+            data.update(updates)
+
+    def close(self) -> None:
+        """Unmap the record file.
+
+        Called automatically when the instance is garbage collected; calling it
+        earlier releases the mapping deterministically (e.g. before the file is
+        removed, which Windows refuses while it is mapped). Safe to call twice.
+        """
+        self._finalizer()
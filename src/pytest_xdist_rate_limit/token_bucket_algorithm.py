@@ -4,17 +4,93 @@ Token Bucket Algorithm
 This module implements the core token bucket rate limiting algorithm.
 The algorithm allows for controlled bursts of activity while maintaining
 an average rate limit.
+
+Bucket times are read from time.monotonic(), which is shared by all processes
+on a host and is not affected by wall clock adjustments.
 """
 
 import logging
 import time
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 from pytest_xdist_rate_limit.exceptions import RateLimitTimeout
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class TokenBucketState:
+    """
+    Token bucket state passed through the algorithm.
+
+    Converted from and to a plain dict only where it is persisted in shared state.
+
+    Attributes:
+        last_refill_time: Time of last refill (in the future if slots are reserved ahead)
+        tokens: Token count at last_refill_time
+    """
+
+    __slots__ = ("last_refill_time", "tokens")
+
+    last_refill_time: float
+    tokens: float
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TokenBucketState":
+        """Build the state from its persisted dict form."""
+        return cls(data["last_refill_time"], data["tokens"])
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the persisted dict form of the state."""
+        return {"last_refill_time": self.last_refill_time, "tokens": self.tokens}
+
+
+def _make_bucket_step(
+    tokens_per_second: float,
+    seconds_per_token: float,
+    burst_capacity: float,
+) -> Callable[[float, float, float], Tuple[float, float, float]]:
+    """Build the arithmetic core of the algorithm for fixed bucket parameters.
+
+    The parameters are bound as closure variables, so the returned function
+    works on plain floats without any attribute lookups.
+
+    Args:
+        tokens_per_second: Refill rate
+        seconds_per_token: Reciprocal of the refill rate
+        burst_capacity: Maximum number of tokens in the bucket
+
+    Returns:
+        Function reserving one token. It takes (current_time, last_refill_time, tokens),
+        where last_refill_time is in the future if slots are reserved ahead and tokens
+        is the count at last_refill_time, and returns (wait_time, tokens,
+        last_refill_time) after the reservation.
+    """
+
+    def bucket_step(
+        current_time: float, last_refill_time: float, tokens: float
+    ) -> Tuple[float, float, float]:
+        ahead = last_refill_time - current_time
+        if ahead > 0:
+            # There are reserved slots. No tokens available until they are paid back.
+            wait_time = ahead + seconds_per_token
+            return wait_time, tokens, current_time + wait_time
+
+        available = tokens - ahead * tokens_per_second
+        if available > burst_capacity:
+            available = burst_capacity
+        if available >= 1:
+            # Pay token with one token (consume immediately)
+            return 0.0, available - 1, current_time
+
+        # Pay token with its wait time equivalent: wait until the debt refills to 0
+        wait_time = (1 - available) * seconds_per_token
+        return wait_time, tokens, current_time + wait_time
+
+    return bucket_step
+
+
 class TokenBucketAlgorithm:
     """
     Implements the token bucket algorithm for rate limiting.
@@ -38,67 +114,58 @@ class TokenBucketAlgorithm:
             hourly_rate: Target rate in calls per hour
             burst_capacity: Maximum number of tokens that can be stored in the bucket
         """
+        self._burst_capacity = burst_capacity
         self.hourly_rate = hourly_rate
-        self.burst_capacity = burst_capacity
 
-    def _initialize_state(self, current_time: float) -> Dict[str, Any]:
+    @property
+    def hourly_rate(self) -> int:
+        """Target rate in calls per hour."""
+        return self._hourly_rate
+
+    @hourly_rate.setter
+    def hourly_rate(self, value: int) -> None:
+        if value <= 0:
+            raise ValueError(f"hourly_rate must be positive, got {value}")
+        self._hourly_rate = value
+        # Derived once here rather than on every reservation
+        self._tokens_per_second = value / 3600
+        self._seconds_per_token = 3600 / value
+        self._specialize()
+
+    @property
+    def burst_capacity(self) -> int:
+        """Maximum number of tokens that can be stored."""
+        return self._burst_capacity
+
+    @burst_capacity.setter
+    def burst_capacity(self, value: int) -> None:
+        self._burst_capacity = value
+        self._specialize()
+
+    def _specialize(self) -> None:
+        """Rebuild the reservation step for the current rate and capacity."""
+        self._bucket_step = _make_bucket_step(
+            self._tokens_per_second, self._seconds_per_token, self._burst_capacity
+        )
+
+    def _initialize_state(self, current_time: float) -> TokenBucketState:
         """Return initial algorithm state (no mutation).
 
         Args:
-            current_time: Current Unix timestamp
-
-        Returns:
-            Dict containing initial algorithm state
-        """
-        return {
-            "last_refill_time": current_time,
-            "tokens": self.burst_capacity,
-        }
-
-    def _refill_tokens(self, tokens: float, last_refill_time: float, current_time: float) -> float:
-        """Calculate and return available tokens after refilling.
-
-        Args:
-            tokens: Current token count
-            last_refill_time: Time of last refill
-            current_time: Current time
-
-        Returns:
-            float: Available tokens (before consumption)
-        """
-        if (current_time - last_refill_time) < 0:
-            return 0
-        tokens_per_second = self.hourly_rate / 3600
-        elapsed_seconds = current_time - last_refill_time
-        new_tokens = elapsed_seconds * tokens_per_second
-        return min(tokens + new_tokens, self.burst_capacity)
-
-
-    def _calculate_wait_time(self, tokens: float) -> float:
-        """Calculate how long to wait based on token availability.
-
-        Args:
-            tokens: Available tokens (before consumption)
+            current_time: Current monotonic time
 
         Returns:
-            float: Wait time in seconds (0 if can proceed immediately)
+            TokenBucketState with a full bucket
         """
-        if tokens >= 1:
-            return 0
-
-        # Calculate wait time to pay back the token debt
-        tokens_per_second = self.hourly_rate / 3600
-        # After consuming, tokens will be (tokens - 1), which is negative
-        # We need to wait until tokens refill to 0
-        return abs(tokens - 1) / tokens_per_second
-
+        return TokenBucketState(last_refill_time=current_time, tokens=self.burst_capacity)
 
     def reserve_token_slot(
         self,
-        algorithm_state: Optional[Dict[str, Any]],
+        algorithm_state: Optional[TokenBucketState],
         limiter_id: str,
-        timeout: Optional[float] = None
-    ) -> Tuple[float, float, Dict[str, Any]]:
+        timeout: Optional[float] = None,
+        current_time: Optional[float] = None
+    ) -> Tuple[float, float, TokenBucketState]:
         """
         Reserve a token slot using algorithm state.
 
@@ -106,12 +173,15 @@ class TokenBucketAlgorithm:
         It returns updated algorithm state via return value.
 
         Args:
-            algorithm_state: Algorithm state dict or None if uninitialized
+            algorithm_state: Algorithm state or None if uninitialized
             limiter_id: Identifier for error messages
             timeout: Maximum wait time in seconds (None for no timeout)
+            current_time: Monotonic time to reserve at, read from the clock if None.
+                          Callers holding the state lock can pass the time they
+                          already read under it.
 
         Returns:
-            Tuple[float, float, Dict[str, Any]]: (wait_time, target_time, updated_algorithm_state)
+            Tuple[float, float, TokenBucketState]: (wait_time, target_time, updated_algorithm_state)
 
         Raises:
             RateLimitTimeout: If timeout is set and wait time exceeds it
@@ -119,38 +189,62 @@ class TokenBucketAlgorithm:
         if timeout is not None and timeout <= 0:
             raise ValueError(f"timeout must be positive, got {timeout}")
 
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.monotonic()
 
         if algorithm_state is None:
             algorithm_state = self._initialize_state(current_time)
 
-        # Work with copy to avoid mutation
-        state = dict(algorithm_state)
-
-        last_refill_time = state["last_refill_time"]
-        current_wait = last_refill_time - current_time
-
-        if current_wait > 0:
-            # There are reserved slots. No tokens available.
-            tokens = 0
-            wait_time = current_wait + self._calculate_wait_time(tokens)
-        else:
-            tokens = self._refill_tokens(state["tokens"], last_refill_time, current_time)
-            wait_time = self._calculate_wait_time(tokens)
+        wait_time, tokens, target_time = self._bucket_step(
+            current_time, algorithm_state.last_refill_time, algorithm_state.tokens
+        )
 
         # Check timeout before reserving slot
         if timeout is not None and wait_time > timeout:
             raise RateLimitTimeout(limiter_id, timeout, wait_time)
 
-        # Update state
-        if wait_time > 0:
-            # Pay token with its wait time equivalent
-            target_time = current_time + wait_time
-        else:
-            # Pay token with one token (consume immediately)
-            state["tokens"] = tokens - 1
-            target_time = current_time
+        return wait_time, target_time, TokenBucketState(last_refill_time=target_time, tokens=tokens)
+
+    def release_token_slots(
+        self,
+        algorithm_state: TokenBucketState,
+        slot_times: Sequence[float],
+        current_time: Optional[float] = None,
+    ) -> TokenBucketState:
+        """
+        Give back token slots that were reserved but never used.
+
+        Does not mutate the input state.
+        Slots still ahead of current_time are returned by moving the next refill
+        time back one whole slot each, but only while they are the tail of the
+        schedule: moving it back past a slot reserved later by another worker
+        would let the next reservation overlap that slot. Future slots behind
+        another worker's are dropped. Slots whose time has come are credited as
+        tokens, capped at burst capacity.
 
-        state["last_refill_time"] = target_time
+        Args:
+            algorithm_state: Algorithm state
+            slot_times: Target times of the unused slots, as returned by reserve_token_slot
+            current_time: Monotonic time to release at, read from the clock if None
 
-        return wait_time, target_time, state
+        Returns:
+            TokenBucketState: Updated algorithm state
+        """
+        if current_time is None:
+            current_time = time.monotonic()
+        last_refill_time = algorithm_state.last_refill_time
+        tokens = algorithm_state.tokens
+        seconds_per_token = self._seconds_per_token
+        # Slot times are sums of floats, so matching them against the schedule needs some slack
+        tolerance = seconds_per_token * 1e-6
+
+        future_slots = sorted(t for t in slot_times if t > current_time)
+        while future_slots and abs(future_slots[-1] - last_refill_time) <= tolerance:
+            future_slots.pop()
+            last_refill_time -= seconds_per_token
+
+        due_slots = sum(1 for t in slot_times if t <= current_time)
+        if due_slots:
+            tokens = min(tokens + due_slots, self.burst_capacity)
+
+        return TokenBucketState(last_refill_time=last_refill_time, tokens=tokens)
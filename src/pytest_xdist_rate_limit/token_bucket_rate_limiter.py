@@ -6,30 +6,53 @@ to generate load at a controlled rate across multiple processes.
 
 The pacer tracks distribution-based statistics using TDigest
 for percentile calculations without storing all samples.
-These statistics are provided via PeriodicCheckEvent callbacks.
+These statistics are provided via PeriodicCheckEvent callbacks and are only
+collected when such a callback is configured.
 """
 from __future__ import annotations
 
 import contextlib
 import logging
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Generator, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Tuple, Union
 
 from pytest_xdist_rate_limit.events import (
     DriftEvent,
     MaxCallsEvent,
     PeriodicCheckEvent,
 )
+from pytest_xdist_rate_limit.exceptions import RateLimitTimeout
 from pytest_xdist_rate_limit.pacer_metrics import PacerMetrics
 from pytest_xdist_rate_limit.rate import Rate
 from pytest_xdist_rate_limit.rate_monitor import RateMonitor
 from pytest_xdist_rate_limit.shared_json import SharedJson
-from pytest_xdist_rate_limit.token_bucket_algorithm import TokenBucketAlgorithm
+from pytest_xdist_rate_limit.shared_struct import SharedStruct
+from pytest_xdist_rate_limit.token_bucket_algorithm import TokenBucketAlgorithm, TokenBucketState
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Fixed layout of the fields touched on every call, for use with SharedStruct.
+# New fields go at the end so records written with an older layout keep their offsets.
+PACER_STATE_LAYOUT = {
+    "start_time": "d",
+    "call_count": "q",
+    "exceptions": "q",
+    "token_bucket": {"last_refill_time": "d", "tokens": "d"},
+    "monotonic_epoch": "d",
+}
+
+# Bucket times are time.monotonic() values, which only compare within one boot.
+# The wall clock time at which the monotonic clock read 0 is stored with them
+# on every write; if it moved by more than this many seconds since (a reboot,
+# or a suspend or clock step that long), the bucket starts over. NTP slewing
+# moves it by at most 0.05% of the time between writes, i.e. 60 s only after
+# a day and a half without calls, by which time the bucket has refilled anyway.
+MONOTONIC_EPOCH_TOLERANCE = 60.0
+
 
 class TokenBucketPacer:
     """
@@ -45,6 +68,12 @@ class TokenBucketPacer:
         with pacer() as ctx:
             print(f"Using pacer {ctx.id} with rate {ctx.hourly_rate}/hr")
             perform_action()
+
+    Exception counts and call statistics are buffered per worker and written
+    to shared state in batches. Call flush() (and release_reserved_slots()
+    when reservation_size > 1) once a worker is done with the pacer; make_pacer
+    does this at session teardown. As a fallback, a pacer that is garbage
+    collected with buffered counts flushes them if its shared files still exist.
     """
 
     def __init__(
@@ -60,6 +89,9 @@ class TokenBucketPacer:
         on_max_calls_callback: Optional[Callable[[MaxCallsEvent], None]] = None,
         on_periodic_check_callback: Optional[Callable[[PeriodicCheckEvent], None]] = None,
         rate_windows: Optional[List[int]] = None,
+        counter_state: Optional[SharedStruct] = None,
+        reservation_size: int = 1,
+        adaptive_drift_checks: bool = False,
     ):
         """
         Initialize a token bucket pacer.
@@ -72,6 +104,8 @@ class TokenBucketPacer:
             max_drift: Maximum allowed drift from the target rate (as a fraction)
             on_drift_callback: Callback function to execute when drift exceeds max_drift
                                Function signature: (event: DriftEvent) -> None
+                               Drift is only checked (and logged) when a callback is
+                               configured or max_calls is set
             num_calls_between_checks: Number of calls between periodic checks (default: 10)
                                      Used for both drift checking and periodic metrics callbacks
             seconds_before_first_check: Minimum elapsed time (seconds) before rate checking begins
@@ -84,7 +118,22 @@ class TokenBucketPacer:
             on_periodic_check_callback: Callback function for periodic metrics checks
                                        Function signature: (event: PeriodicCheckEvent) -> None
                                        Provides metrics for custom analysis (bottleneck detection, monitoring, etc.)
+                                       Call statistics are only collected when this is set,
+                                       and each worker writes them at least every
+                                       num_calls_between_checks of its own calls
             rate_windows: Time windows in seconds for rate calculation (default: [60, 300, 900])
+            counter_state: Optional SharedStruct (with PACER_STATE_LAYOUT) holding the fields
+                           updated on every call: start time, call and exception counts and
+                           token bucket state. When omitted, they are kept in shared_state.
+            reservation_size: Maximum number of token slots each worker takes from the shared
+                              bucket per trip (default: 1). With larger values, tokens that
+                              are available right away are leased in one locked trip and the
+                              following calls are served locally without touching shared
+                              state. When the bucket is empty, calls are paced one slot at a
+                              time as usual. Unused slots are handed back by
+                              release_reserved_slots().
+            adaptive_drift_checks: Check drift less often while it stays well below max_drift
+                                   (default: False). See RateMonitor for details.
         """
         # Validate input parameters
         if not 0 <= max_drift <= 1:
@@ -99,21 +148,45 @@ class TokenBucketPacer:
             )
         if burst_capacity is not None and burst_capacity < 1:
             raise ValueError(f"burst_capacity must be positive, got {burst_capacity}")
+        if reservation_size < 1:
+            raise ValueError(f"reservation_size must be positive, got {reservation_size}")
 
         self.shared_state = shared_state
-        self._hourly_rate = hourly_rate
+        # Derived from the data file path, which does not change
+        self._id = shared_state.name
+        self.counter_state = counter_state if counter_state is not None else shared_state
+        # A fixed Rate is resolved once; a callable is called on every access
+        if callable(hourly_rate):
+            self._rate_callable: Optional[Callable[[], Rate]] = hourly_rate
+            self._fixed_hourly_rate = 0
+        else:
+            self._rate_callable = None
+            self._fixed_hourly_rate = hourly_rate.calls_per_hour
         self.num_calls_between_checks = num_calls_between_checks
         self.max_calls = max_calls
+        self.reservation_size = reservation_size
+
+        # Slots reserved from the shared bucket but not yet used by this worker
+        self._reservation_lock = threading.Lock()
+        self._reserved_slots: Deque[float] = deque()
+        self._reserved_state: Dict[str, Any] = {}
+
+        # Exceptions and call statistics (entry_ns, duration, wait_time) not yet
+        # written to shared state
+        self._pending_lock = threading.Lock()
+        self._pending_exceptions = 0
+        self._pending_stats: List[Tuple[int, float, float]] = []
 
+        initial_hourly_rate = self.hourly_rate
         calculated_burst_capacity = (
             burst_capacity
             if burst_capacity is not None
-            else self._calculate_default_burst_capacity(self.hourly_rate)
+            else self._calculate_default_burst_capacity(initial_hourly_rate)
         )
         self.burst_capacity = calculated_burst_capacity
 
         self.algorithm = TokenBucketAlgorithm(
-            hourly_rate=self.hourly_rate,
+            hourly_rate=initial_hourly_rate,
             burst_capacity=calculated_burst_capacity
         )
 
@@ -121,12 +194,20 @@ class TokenBucketPacer:
             rate_windows=rate_windows if rate_windows is not None else [60, 300, 900]
         )
 
+        # Without callbacks or max_calls there is nothing for checkpoints to do
+        self._monitoring_enabled = bool(
+            on_drift_callback or on_periodic_check_callback or on_max_calls_callback or max_calls > 0
+        )
+        # Call statistics are only read by periodic check callbacks
+        self._track_durations = on_periodic_check_callback is not None
+
         self.rate_monitor = RateMonitor(
             max_drift=max_drift,
             seconds_before_first_check=seconds_before_first_check,
             on_drift_callback=on_drift_callback,
             on_periodic_check_callback=on_periodic_check_callback,
-            on_max_calls_callback=on_max_calls_callback
+            on_max_calls_callback=on_max_calls_callback,
+            adaptive_drift_checks=adaptive_drift_checks
         )
 
     @staticmethod
@@ -137,20 +218,189 @@ class TokenBucketPacer:
     @property
     def id(self) -> str:
         """Get the identifier from the shared state name."""
-        return self.shared_state.name
+        return self._id
 
     @property
     def hourly_rate(self) -> int:
         """Get the current hourly rate."""
-        rate = self._hourly_rate() if callable(self._hourly_rate) else self._hourly_rate
-        return rate.calls_per_hour
+        if self._rate_callable is None:
+            return self._fixed_hourly_rate
+        return self._rate_callable().calls_per_hour
 
 
     def _track_exception(self) -> None:
-        """Track that an exception occurred during rate-limited execution."""
+        """Track that an exception occurred during rate-limited execution.
+
+        The count is added to the shared state the next time this worker locks
+        it, rather than locking it once more per exception.
+        """
+        with self._pending_lock:
+            self._pending_exceptions += 1
+
+    def _fold_pending_exceptions(self, state: Dict[str, Any]) -> None:
+        """Add the exceptions counted by this worker to a locked counter_state dict."""
+        with self._pending_lock:
+            pending, self._pending_exceptions = self._pending_exceptions, 0
+        state["exceptions"] += pending
+
+
+    @staticmethod
+    def _load_bucket_state(state: Dict[str, Any], current_time: float) -> Optional[TokenBucketState]:
+        """Return the token bucket state stored in the shared state.
+
+        Args:
+            state: Locked counter_state dict
+            current_time: Monotonic time read under the lock
+
+        Returns:
+            The stored state, or None if not set yet or stored under another
+            monotonic clock epoch (e.g. by a run before a reboot)
+        """
+        bucket = state.get("token_bucket")
+        if bucket is None:
+            return None
+        stored_epoch = state.get("monotonic_epoch")
+        if stored_epoch is None or abs(time.time() - current_time - stored_epoch) > MONOTONIC_EPOCH_TOLERANCE:
+            logger.warning("Token bucket state was stored under another monotonic clock epoch; resetting it")
+            return None
+        return TokenBucketState.from_dict(bucket)
+
+    @staticmethod
+    def _store_bucket_state(state: Dict[str, Any], algo_state: TokenBucketState, current_time: float) -> None:
+        """Write the token bucket state and the current monotonic clock epoch to a locked counter_state dict."""
+        state["token_bucket"] = algo_state.to_dict()
+        state["monotonic_epoch"] = time.time() - current_time
+
+    def _fold_pending_stats(self, state: Dict[str, Any]) -> None:
+        """Fold the call statistics recorded by this worker into a locked shared_state dict."""
+        with self._pending_lock:
+            if not self._pending_stats:
+                return
+            pending, self._pending_stats = self._pending_stats, []
+
+        stats_state = state.get("statistics") or self.metrics.new_state()
+        for _, call_duration, wait_time in pending:
+            self.metrics.update_duration_stats(stats_state=stats_state, duration=call_duration)
+            self.metrics.update_wait_stats(stats_state=stats_state, wait_time=wait_time)
+        self.metrics.track_call_timestamps(
+            stats_state=stats_state, timestamps=[entry_ns for entry_ns, _, _ in pending]
+        )
+        state["statistics"] = stats_state
+
+    def flush_statistics(self) -> Dict[str, Any]:
+        """Write the call statistics recorded by this worker to the shared state.
+
+        Statistics are buffered per worker and written in batches: while the
+        shared state is locked for a reservation (when it also holds the
+        counters), at periodic checks, and whenever a worker has buffered
+        num_calls_between_checks calls. Periodic checks therefore miss at most
+        num_calls_between_checks - 1 recent calls from each worker.
+
+        Returns:
+            Dict[str, Any]: The shared statistics state after the flush
+        """
+        if not self._pending_stats:
+            return self.shared_state.read().get("statistics", {})
         with self.shared_state.locked_dict() as state:
-            state["exceptions"] = state.get("exceptions", 0) + 1
+            self._fold_pending_stats(state)
+            return state.get("statistics", {})
+
+    def flush(self) -> None:
+        """Write the exception counts and call statistics buffered by this worker to the shared state."""
+        if self._pending_exceptions:
+            with self.counter_state.locked_dict() as state:
+                self._fold_pending_exceptions(state)
+        self.flush_statistics()
+
+    def __del__(self) -> None:
+        # Fallback for pacers built directly and never flushed; make_pacer flushes at
+        # teardown, before the shared files are removed, leaving nothing to do here
+        with contextlib.suppress(Exception):
+            if not (self._pending_exceptions or self._pending_stats):
+                return
+            if self.counter_state.data_file.exists() and self.shared_state.data_file.exists():
+                self.flush()
+
+    def _reserve_slots(self, timeout: Optional[float]) -> None:
+        """Reserve up to reservation_size slots from the shared bucket in one locked trip.
+
+        The first slot is always reserved, waiting if needed. Further slots are
+        only taken while tokens are available right away, so a worker never
+        queues up future slots that other workers could be using. With max_calls
+        set, the batch is also capped at the calls remaining before the limit.
+
+        Must be called with _reservation_lock held.
+        """
+        with self.counter_state.locked_dict() as state:
+            # One clock read under the lock serves the whole batch
+            current_time = time.monotonic()
+            if "start_time" not in state:
+                state["start_time"] = time.time()
+                state["call_count"] = 0
+                state["exceptions"] = 0
+            self._fold_pending_exceptions(state)
+
+            batch_size = self.reservation_size
+            if self.max_calls > 0:
+                batch_size = max(1, min(batch_size, self.max_calls - state["call_count"]))
 
+            algo_state = self._load_bucket_state(state, current_time)
+            for i in range(batch_size):
+                wait_time, target_time, next_algo_state = self.algorithm.reserve_token_slot(
+                    algorithm_state=algo_state,
+                    limiter_id=self.id,
+                    timeout=timeout if i == 0 else None,
+                    current_time=current_time
+                )
+                if i > 0 and wait_time > 0:
+                    break
+                algo_state = next_algo_state
+                self._reserved_slots.append(target_time)
+            self._store_bucket_state(state, algo_state, current_time)
+            if self.counter_state is self.shared_state:
+                self._fold_pending_stats(state)
+
+            self._reserved_state = dict(state)
+            state["call_count"] += len(self._reserved_slots)
+
+    def _take_reserved_slot(
+        self, timeout: Optional[float]
+    ) -> Tuple[float, float, Dict[str, Any]]:
+        """Take the next locally reserved slot, reserving a new batch if none are left."""
+        with self._reservation_lock:
+            if not self._reserved_slots:
+                self._reserve_slots(timeout)
+
+            target_time = self._reserved_slots[0]
+            wait_time = max(0.0, target_time - time.monotonic())
+            if timeout is not None and wait_time > timeout:
+                raise RateLimitTimeout(self.id, timeout, wait_time)
+            self._reserved_slots.popleft()
+
+            self._reserved_state["call_count"] += 1
+            return wait_time, target_time, dict(self._reserved_state)
+
+    def release_reserved_slots(self) -> None:
+        """Hand slots reserved by this worker but never used back to the shared bucket."""
+        with self._reservation_lock:
+            if not self._reserved_slots:
+                return
+            slot_times = list(self._reserved_slots)
+            self._reserved_slots.clear()
+            with self.counter_state.locked_dict() as state:
+                current_time = time.monotonic()
+                algo_state = self._load_bucket_state(state, current_time)
+                if algo_state is not None:
+                    self._store_bucket_state(
+                        state,
+                        self.algorithm.release_token_slots(
+                            algorithm_state=algo_state,
+                            slot_times=slot_times,
+                            current_time=current_time,
+                        ),
+                        current_time,
+                    )
+                state["call_count"] -= len(slot_times)
 
     @dataclass
     class RateLimitContext:
@@ -166,31 +416,23 @@ class TokenBucketPacer:
             seconds_waited: Number of seconds waited before entering the context
         """
 
+        # One is created per call; dataclass(slots=True) needs Python 3.10
+        __slots__ = ("_limiter", "call_count", "exceptions", "start_time", "seconds_waited")
+
         _limiter: TokenBucketPacer
-        _state: dict
-        seconds_waited: float = 0.0
+        call_count: int
+        exceptions: int
+        start_time: float
+        seconds_waited: float
 
         @property
         def id(self) -> str:
-            return self._limiter.shared_state.name
+            return self._limiter.id
 
         @property
         def hourly_rate(self) -> int:
             return self._limiter.hourly_rate
 
-        @property
-        def call_count(self) -> int:
-            return self._state["call_count"]
-
-        @property
-        def exceptions(self) -> int:
-            return self._state["exceptions"]
-
-        @property
-        def start_time(self) -> float:
-            """Timestamp of when the first call was made (Unix timestamp)."""
-            return self._state["start_time"]
-
     def __call__(self, timeout: Optional[float] = None):
         """
         Make the rate limiter callable as a context manager.
@@ -221,92 +463,89 @@ class TokenBucketPacer:
                 print(f"Will timeout after 5 seconds")
                 perform_action()
         """
-        current_time = time.time()
-
-        # Reserve token slot
-        with self.shared_state.locked_dict() as state:
-            # Initialize top-level orchestrator fields if needed
-            if "start_time" not in state:
-                state["start_time"] = current_time
-                state["call_count"] = 0
-                state["exceptions"] = 0
-
-            wait_time, target_time, updated_algo_state = self.algorithm.reserve_token_slot(
-                algorithm_state=state.get("token_bucket"),
-                limiter_id=self.id,
-                timeout=timeout
-            )
-            state["token_bucket"] = updated_algo_state
+        if self.reservation_size > 1:
+            wait_time, target_time, state_snapshot = self._take_reserved_slot(timeout)
+        else:
+            # Reserve token slot
+            with self.counter_state.locked_dict() as state:
+                # Read the clock under the lock; slots are timed on the monotonic clock
+                current_time = time.monotonic()
+
+                # Initialize top-level orchestrator fields if needed
+                if "start_time" not in state:
+                    state["start_time"] = time.time()
+                    state["call_count"] = 0
+                    state["exceptions"] = 0
+                self._fold_pending_exceptions(state)
+
+                wait_time, target_time, updated_algo_state = self.algorithm.reserve_token_slot(
+                    algorithm_state=self._load_bucket_state(state, current_time),
+                    limiter_id=self.id,
+                    timeout=timeout,
+                    current_time=current_time
+                )
+                self._store_bucket_state(state, updated_algo_state, current_time)
 
-            # Increment call count (orchestrator responsibility)
-            state["call_count"] += 1
-            call_count = state["call_count"]
+                # Increment call count (orchestrator responsibility)
+                state["call_count"] += 1
 
-            # Collect monitoring data inside lock for callbacks outside lock
-            should_check_periodic = call_count % self.num_calls_between_checks == 0
+                # Statistics share the file, so write them while it is locked anyway
+                if self.counter_state is self.shared_state:
+                    self._fold_pending_stats(state)
 
-            state_snapshot = dict(state)
+                # locked_dict yields a fresh dict per call, so it can be kept as is
+                state_snapshot = state
 
         # Invoke monitoring callbacks outside lock to avoid blocking other workers
-        if should_check_periodic:
-            self.rate_monitor.check_rate(
-                state=state_snapshot,
-                limiter_id=self.id,
-                target_rate=self.hourly_rate,
-                limiter=self
-            )
-            stats_state = state_snapshot.get("statistics", {})
-            self.rate_monitor.periodic_check(
+        if (
+            self._monitoring_enabled
+            and state_snapshot["call_count"] % self.num_calls_between_checks == 0
+        ):
+            if self._track_durations and (
+                self._pending_stats or self.counter_state is not self.shared_state
+            ):
+                state_snapshot["statistics"] = self.flush_statistics()
+            self.rate_monitor.on_checkpoint(
                 state=state_snapshot,
-                stats_state=stats_state,
+                stats_state=state_snapshot.get("statistics", {}),
                 limiter_id=self.id,
                 target_rate=self.hourly_rate,
                 limiter=self,
-                metrics=self.metrics
+                metrics=self.metrics,
+                max_calls=self.max_calls
             )
-            if self.max_calls > 0 and call_count >= self.max_calls:
-                self.rate_monitor.check_max_calls(
-                    call_count=call_count,
-                    max_calls=self.max_calls,
-                    state_snapshot=state_snapshot,
-                    limiter_id=self.id,
-                    limiter=self
-                )
 
         # Sleep outside lock
         if wait_time > 0:
-            actual_wait = target_time - time.time()
+            actual_wait = target_time - time.monotonic()
             if actual_wait > 0:
-                logger.debug(
-                    f"Token bucket rate limiter {self.id} waiting for {actual_wait:.2f} seconds"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Token bucket rate limiter {self.id} waiting for {actual_wait:.2f} seconds"
+                    )
                 time.sleep(actual_wait)
 
-        entry_time = time.perf_counter()
-        context = self.RateLimitContext(self, state_snapshot, seconds_waited=wait_time)
+        entry_ns = time.perf_counter_ns() if self._track_durations else 0
+        context = self.RateLimitContext(
+            self,
+            call_count=state_snapshot["call_count"],
+            exceptions=state_snapshot["exceptions"],
+            start_time=state_snapshot["start_time"],
+            seconds_waited=wait_time,
+        )
 
         try:
             yield context
         except Exception:
-            with self.shared_state.locked_dict() as state:
-                state["exceptions"] = state.get("exceptions", 0) + 1
+            self._track_exception()
             raise
         finally:
-            call_duration = time.perf_counter() - entry_time
-
-            # Update statistics
-            with self.shared_state.locked_dict() as state:
-                stats_state = state.get("statistics")
-                stats_state = self.metrics.update_duration_stats(
-                    stats_state=stats_state,
-                    duration=call_duration
-                )
-                stats_state = self.metrics.update_wait_stats(
-                    stats_state=stats_state,
-                    wait_time=wait_time
-                )
-                stats_state = self.metrics.track_call_timestamp(
-                    stats_state=stats_state,
-                    timestamp=entry_time
-                )
-                state["statistics"] = stats_state
+            if self._track_durations:
+                call_duration = (time.perf_counter_ns() - entry_ns) / 1e9
+                # Buffered without locking shared state; written by the next flush,
+                # which this worker forces once a checkpoint interval's worth is pending
+                with self._pending_lock:
+                    self._pending_stats.append((entry_ns, call_duration, wait_time))
+                    flush_due = len(self._pending_stats) >= self.num_calls_between_checks
+                if flush_due:
+                    self.flush_statistics()
@@ -0,0 +1,66 @@
+"""Thread pool limits for pytest-xdist workers.
+
+Libraries backed by BLAS/OpenMP start one thread per CPU in every worker
+process, so with `-n auto` the machine ends up oversubscribed and call
+durations and rates become noisy. When the `limit_worker_threads` ini option
+is enabled, each worker caps those thread pools to its share of the CPUs
+using threadpoolctl (optional, install the `threads` extra).
+"""
+
+import logging
+import os
+from typing import Generator, Optional
+
+import pytest
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # pragma: no cover - optional dependency
+    threadpool_limits = None
+
+logger = logging.getLogger(__name__)
+
+# Constants
+LIMIT_WORKER_THREADS_INI = "limit_worker_threads"
+
+
+def worker_thread_limit(worker_count: int, cpu_count: Optional[int] = None) -> int:
+    """Return the number of threads each worker should use.
+
+    Args:
+        worker_count: Number of pytest-xdist workers
+        cpu_count: Number of CPUs (defaults to os.cpu_count())
+
+    Returns:
+        int: CPUs per worker, at least 1
+    """
+    cpus = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    return max(1, cpus // max(1, worker_count))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def limit_worker_threads(request: pytest.FixtureRequest) -> Generator[Optional[int], None, None]:
+    """Cap native thread pools to this worker's share of the CPUs.
+
+    Does nothing unless the `limit_worker_threads` ini option is true and the
+    session runs under pytest-xdist.
+
+    Yields:
+        Optional[int]: The per-worker thread limit, or None if no limit was applied
+    """
+    worker_count = os.environ.get("PYTEST_XDIST_WORKER_COUNT")
+    if not request.config.getini(LIMIT_WORKER_THREADS_INI) or worker_count is None:
+        yield None
+        return
+
+    if threadpool_limits is None:
+        logger.warning(
+            f"{LIMIT_WORKER_THREADS_INI} is enabled but threadpoolctl is not installed; "
+            "thread pools are not limited"
+        )
+        yield None
+        return
+
+    max_threads = worker_thread_limit(int(worker_count))
+    with threadpool_limits(limits=max_threads):
+        yield max_threads
@@ -1,9 +1,35 @@
+import os
+from pathlib import Path
+
 import pytest
 from _pytest.pytester import Pytester
 
 pytest_plugins = ["pytester", "pytest_xdist_load_testing"]
 
 PYTESTER_TIMEOUT = 10
+OUTPUT_CHUNK_BYTES = 64 * 1024
+
+
+def read_head_and_tail(path: Path, chunk: int = OUTPUT_CHUNK_BYTES) -> str:
+    """Read at most the first and last chunk bytes of a possibly huge output file.
+
+    Args:
+        path: File to read
+        chunk: Number of bytes to keep from each end
+
+    Returns:
+        The whole text if it fits in two chunks, otherwise its head and tail
+    """
+    if not path.exists():
+        return f"<no {path.name}>"
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= 2 * chunk:
+            return f.read().decode(errors="replace")
+        head = f.read(chunk).decode(errors="replace")
+        f.seek(size - chunk)
+        tail = f.read(chunk).decode(errors="replace")
+    return f"{head}\n\n... ({size - 2 * chunk} bytes omitted) ...\n\n{tail}"
 
 
 @pytest.fixture(autouse=True)
@@ -38,24 +64,9 @@ def run_with_timeout():
         try:
             return pytester.runpytest_subprocess(*args, timeout=timeout, **kwargs)
         except Pytester.TimeoutExpired as e:
-            # Read stdout/stderr from pytester path
-            stdout_path = pytester.path.joinpath("stdout")
-            stderr_path = pytester.path.joinpath("stderr")
-
-            stdout = stdout_path.read_text() if stdout_path.exists() else "<no stdout>"
-            stderr = stderr_path.read_text() if stderr_path.exists() else "<no stderr>"
-
-            # Truncate long output (first 100 + last 100 lines if > 200 lines)
-            def truncate_output(text: str) -> str:
-                lines = text.splitlines()
-                if len(lines) > 200:
-                    first_100 = "\n".join(lines[:100])
-                    last_100 = "\n".join(lines[-100:])
-                    return f"{first_100}\n\n... ({len(lines) - 200} lines omitted) ...\n\n{last_100}"
-                return text
-
-            stdout = truncate_output(stdout)
-            stderr = truncate_output(stderr)
+            # Read stdout/stderr from pytester path; a hung load test can log a lot
+            stdout = read_head_and_tail(pytester.path / "stdout")
+            stderr = read_head_and_tail(pytester.path / "stderr")
 
             pytest.fail(
                 f"Test timed out after {timeout} seconds - load test did not complete\n"
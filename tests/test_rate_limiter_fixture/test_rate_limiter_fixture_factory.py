@@ -201,3 +201,32 @@ def test_rate_limiter_across_workers(pytester, run_with_timeout):
     result = run_with_timeout(pytester, "-n", "3", "-v")
     outcomes = result.parseoutcomes()
     assert "passed" in outcomes and outcomes["passed"] == 4, str(result.stdout)
+
+
+def test_pacer_names_cannot_collide_with_counter_state(pytester, run_with_timeout):
+    """Test that counter records use a reserved name that pacers cannot take."""
+    pytester.makeconftest(CONFTEST_CONTENT)
+    pytester.makepyfile(
+        """
+        import pytest
+        from pytest_xdist_rate_limit import Rate
+        from pytest_xdist_rate_limit.rate_limiter_fixture import COUNTER_STATE_PREFIX
+
+        def test_reserved_prefix_is_rejected(make_pacer):
+            with pytest.raises(ValueError, match="reserved prefix"):
+                make_pacer(name=f"{COUNTER_STATE_PREFIX}api", hourly_rate=Rate.per_second(5))
+
+        def test_counters_suffix_is_a_separate_pacer(make_pacer):
+            api = make_pacer(name="api", hourly_rate=Rate.per_second(5), burst_capacity=10)
+            api_counters = make_pacer(name="api_counters", hourly_rate=Rate.per_second(5), burst_capacity=10)
+            with api():
+                pass
+            with api_counters() as ctx:
+                assert ctx.call_count == 1
+            assert api.counter_state.read()["call_count"] == 1
+            assert "call_count" not in api_counters.shared_state.read()
+        """
+    )
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 2, str(result.stdout)
@@ -207,3 +207,45 @@ def test_race_condition_with_exact_worker_count(pytester, run_with_timeout):
         "The race condition allowed multiple workers to pass the "
         "'is_last' check (len(finished_workers) >= total_workers)."
     )
+
+
+def test_leftover_teardown_markers_do_not_block_last_worker(pytester, run_with_timeout):
+    """Test that markers left by a run that crashed in teardown do not stop later runs.
+
+    Without xdist the shared directory outlives the session, so a crashed run
+    can leave its "done" and "claimed" markers behind.
+    """
+    pytester.makeconftest("""
+        pytest_plugins = ['pytest_xdist_rate_limit.shared_json']
+    """)
+
+    for leftover_dir in ("pytest_factory_teardown", "pytest_factory_teardown_crashed-run"):
+        (pytester.path / leftover_dir).mkdir()
+        (pytester.path / leftover_dir / "master.done").touch()
+        (pytester.path / leftover_dir / "last.claimed").touch()
+
+    callback_log = pytester.path / "callback_log.txt"
+
+    pytester.makepyfile(f"""
+        import pytest
+        from pathlib import Path
+
+        @pytest.fixture(scope="session")
+        def my_shared(make_shared_json):
+            log_file = Path(r"{callback_log}")
+
+            def log_callback(shared):
+                with log_file.open("a") as f:
+                    f.write("called\\n")
+
+            return make_shared_json("leftover_test", on_first_worker={{}}, on_last_worker=log_callback)
+
+        def test_uses_fixture(my_shared):
+            pass
+    """)
+
+    for run in range(1, 3):
+        result = run_with_timeout(pytester, "-v")
+        outcomes = result.parseoutcomes()
+        assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+        assert callback_log.read_text().splitlines() == ["called"] * run
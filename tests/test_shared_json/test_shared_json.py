@@ -152,6 +152,37 @@ def test_read_returns_copy(pytester, run_with_timeout):
     assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
 
 
+def test_read_returns_copy_on_cache_hit(pytester, run_with_timeout):
+    """Test that read() of an unchanged, cached file still returns a fresh copy."""
+    pytester.makepyfile("""
+        import os
+        import time
+        from pytest_xdist_rate_limit import SharedJson
+
+        def test_read_cached_snapshot(tmp_path):
+            data_file = tmp_path / "test.json"
+            lock_file = tmp_path / "test.lock"
+
+            data_file.write_text('{"stats": {"samples": [1, 2]}}')
+            # Old enough to be cached
+            settled = time.time() - 10
+            os.utime(data_file, (settled, settled))
+
+            shared = SharedJson(data_file, lock_file)
+
+            data = shared.read()
+            data["stats"]["samples"].append(3)
+
+            assert shared.read() == {"stats": {"samples": [1, 2]}}
+            assert shared.read_view()["stats"] == {"samples": [1, 2]}
+            assert shared.read() is not shared.read()
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
 def test_read_empty_file(pytester, run_with_timeout):
     """Test that read() returns empty dict for non-existent file."""
     pytester.makepyfile("""
@@ -344,3 +375,108 @@ def test_concurrent_access_with_xdist(pytester, run_with_timeout):
     # Both workers should have participated
     total_tests = gw0_count + gw1_count
     assert total_tests >= 10, f"Expected at least 10 test runs, got {total_tests}"
+
+
+def test_read_sees_same_size_rewrite(pytester, run_with_timeout):
+    """Test that read() is not fooled by a rewrite that keeps the file size."""
+    pytester.makepyfile("""
+        from pytest_xdist_rate_limit import SharedJson
+
+        def test_same_size_rewrite(tmp_path):
+            data_file = tmp_path / "test.json"
+            lock_file = tmp_path / "test.lock"
+
+            reader = SharedJson(data_file, lock_file)
+            writer = SharedJson(data_file, lock_file)
+
+            writer.update({"count": 10})
+            assert reader.read() == {"count": 10}
+
+            # Same serialized size, written within the same timestamp tick
+            writer.update({"count": 11})
+            assert reader.read() == {"count": 11}
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
+def test_debug_dump(pytester, run_with_timeout):
+    """Test that debug_dump() renders the data as indented JSON."""
+    pytester.makepyfile("""
+        import json
+        from pytest_xdist_rate_limit import SharedJson
+
+        def test_dump(tmp_path):
+            shared = SharedJson(tmp_path / "test.json", tmp_path / "test.lock")
+            shared.update({"b": 2, "a": {"nested": 1}})
+
+            dump = shared.debug_dump()
+            assert json.loads(dump) == {"a": {"nested": 1}, "b": 2}
+            assert dump.startswith('{\\n  "a": {')
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
+def test_wait_for(pytester, run_with_timeout):
+    """Test that wait_for() returns once another writer satisfies the predicate."""
+    pytester.makepyfile("""
+        import threading
+        import time
+        from pytest_xdist_rate_limit import SharedJson
+
+        def test_wait(tmp_path):
+            data_file = tmp_path / "test.json"
+            lock_file = tmp_path / "test.lock"
+            waiter = SharedJson(data_file, lock_file)
+            writer = SharedJson(data_file, lock_file)
+
+            def write_later():
+                time.sleep(0.2)
+                writer.update({"ready": 2})
+
+            thread = threading.Thread(target=write_later)
+            thread.start()
+            assert waiter.wait_for(lambda d: d.get("ready", 0) >= 2, timeout=5)
+            thread.join()
+
+            start = time.time()
+            assert not waiter.wait_for(lambda d: d.get("ready", 0) >= 3, timeout=0.3)
+            assert time.time() - start < 1
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
+def test_read_view_is_read_only(pytester, run_with_timeout):
+    """Test that read_view() returns a read-only view that tracks updates."""
+    pytester.makepyfile("""
+        import pytest
+        from pytest_xdist_rate_limit import SharedJson
+
+        def test_view(tmp_path):
+            data_file = tmp_path / "test.json"
+            lock_file = tmp_path / "test.lock"
+            shared = SharedJson(data_file, lock_file)
+
+            assert dict(shared.read_view()) == {}
+
+            shared.update({"count": 1})
+            view = shared.read_view()
+            assert view["count"] == 1
+            with pytest.raises(TypeError):
+                view["count"] = 2
+
+            shared.update({"count": 3})
+            assert shared.read_view().get("count") == 3
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
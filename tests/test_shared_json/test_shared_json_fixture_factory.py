@@ -1,5 +1,8 @@
 """Tests for make_shared_json using pytester."""
 
+import os
+import time
+
 import pytest
 
 
@@ -313,6 +316,57 @@ def test_factory_initialization_race_condition(pytester, run_with_timeout):
     assert result.ret == pytest.ExitCode.INTERRUPTED
 
 
+def test_empty_init_marker_is_reclaimed(pytester, run_with_timeout):
+    """Test that an empty init marker left by an earlier run does not block initialization."""
+    # Left behind by a crash between creating the marker and writing to it
+    init_marker = pytester.path / "stale_init_init.marker"
+    init_marker.touch()
+    os.utime(init_marker, (time.time() - 60, time.time() - 60))
+
+    pytester.makeconftest("""
+        pytest_plugins = ['pytest_xdist_rate_limit.shared_json']
+    """)
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.fixture(scope="session")
+        def my_shared(make_shared_json):
+            return make_shared_json("stale_init", on_first_worker={'initialized': True})
+
+        def test_init_despite_marker(my_shared):
+            assert my_shared.read() == {'initialized': True}
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+    assert not init_marker.exists()
+
+
+def test_ready_init_marker_without_data_is_reclaimed(pytester, run_with_timeout):
+    """Test that a ready marker from an earlier run is ignored once its data file is gone."""
+    init_marker = pytester.path / "orphan_init_init.marker"
+    init_marker.write_text(f"earlier-run {os.getpid()}\nready\n")
+
+    pytester.makeconftest("""
+        pytest_plugins = ['pytest_xdist_rate_limit.shared_json']
+    """)
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.fixture(scope="session")
+        def my_shared(make_shared_json):
+            return make_shared_json("orphan_init", on_first_worker={'initialized': True})
+
+        def test_init_despite_marker(my_shared):
+            assert my_shared.read() == {'initialized': True}
+    """)
+
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
 def test_timeout_on_locked_dict(pytester, run_with_timeout):
     """Test that timeout is respected when acquiring lock for locked_dict."""
     pytester.makeconftest("""
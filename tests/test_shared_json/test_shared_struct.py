@@ -0,0 +1,92 @@
+"""Tests for SharedStruct."""
+
+import pytest
+
+from pytest_xdist_rate_limit import SharedStruct
+
+LAYOUT = {
+    "count": "q",
+    "start_time": "d",
+    "bucket": {"tokens": "d", "last_refill_time": "d"},
+}
+
+
+def make_struct(tmp_path, name="record"):
+    return SharedStruct(tmp_path / f"{name}.bin", tmp_path / f"{name}.lock", LAYOUT)
+
+
+def test_keys_start_absent(tmp_path):
+    """Test that a fresh record has no keys."""
+    shared = make_struct(tmp_path)
+
+    assert shared.read() == {}
+    with shared.locked_dict() as data:
+        assert "count" not in data
+
+
+def test_locked_dict_round_trip(tmp_path):
+    """Test that scalar and nested fields are written back."""
+    shared = make_struct(tmp_path)
+
+    with shared.locked_dict() as data:
+        data["count"] = 1
+        data["bucket"] = {"tokens": 2.5, "last_refill_time": 10.0}
+
+    with shared.locked_dict() as data:
+        data["count"] += 1
+        data["bucket"]["tokens"] -= 1
+
+    assert shared.read() == {
+        "count": 2,
+        "bucket": {"tokens": 1.5, "last_refill_time": 10.0},
+    }
+
+
+def test_state_is_shared_between_instances(tmp_path):
+    """Test that two instances on the same file see each other's writes."""
+    first = make_struct(tmp_path)
+    second = make_struct(tmp_path)
+
+    first.update({"count": 7, "start_time": 123.5})
+
+    assert second.read() == {"count": 7, "start_time": 123.5}
+
+
+def test_deleted_keys_become_absent(tmp_path):
+    """Test that removing a key from the dict clears it from the record."""
+    shared = make_struct(tmp_path)
+    shared.update({"count": 3, "start_time": 1.0})
+
+    with shared.locked_dict() as data:
+        del data["count"]
+
+    assert shared.read() == {"start_time": 1.0}
+
+
+def test_unknown_key_is_rejected(tmp_path):
+    """Test that keys outside the layout raise KeyError."""
+    shared = make_struct(tmp_path)
+
+    with pytest.raises(KeyError, match="not_a_field"):
+        shared.update({"not_a_field": 1})
+    assert shared.read() == {}
+
+
+def test_name_property_strips_prefix(tmp_path):
+    """Test that name drops the pytest_shared_ prefix like SharedJson."""
+    shared = make_struct(tmp_path, name="pytest_shared_counters")
+
+    assert shared.name == "counters"
+
+
+def test_close_is_idempotent(tmp_path):
+    """Test that close() unmaps the record and can be called again safely."""
+    shared = make_struct(tmp_path)
+    shared.update({"count": 1})
+
+    shared.close()
+    shared.close()
+
+    with pytest.raises(ValueError):
+        shared.read()
+    assert make_struct(tmp_path).read() == {"count": 1}
@@ -0,0 +1,148 @@
+"""Tests for PacerMetrics digest and timestamp bookkeeping."""
+
+import time
+
+import pytest
+
+from pytest_xdist_rate_limit.pacer_metrics import DIGEST_FLUSH_THRESHOLD, NANOSECONDS_PER_SECOND, PacerMetrics
+
+
+def _record(metrics, stats_state, count):
+    for i in range(count):
+        stats_state = metrics.update_duration_stats(stats_state, float(i))
+        stats_state = metrics.update_wait_stats(stats_state, float(i))
+    return stats_state
+
+
+def test_buffered_samples_are_included_in_digests():
+    """Samples not yet flushed into the digest still show up when reading it."""
+    metrics = PacerMetrics(rate_windows=[60])
+    stats_state = _record(metrics, metrics.new_state(), DIGEST_FLUSH_THRESHOLD + 5)
+
+    assert "duration_digest" in stats_state
+    assert len(stats_state["duration_digest_buffer"]) == 5
+    assert metrics.get_sample_count(stats_state) == DIGEST_FLUSH_THRESHOLD + 5
+    assert metrics.get_duration_digest(stats_state).n_values == DIGEST_FLUSH_THRESHOLD + 5
+    assert metrics.get_wait_digest(stats_state).n_values == DIGEST_FLUSH_THRESHOLD + 5
+
+
+def test_digests_available_before_first_flush():
+    """Digests are built from the buffer alone once min_samples is reached."""
+    metrics = PacerMetrics(rate_windows=[60])
+    stats_state = _record(metrics, metrics.new_state(), 10)
+
+    assert "duration_digest" not in stats_state
+    assert metrics.get_duration_digest(stats_state, min_samples=10).n_values == 10
+    assert metrics.get_wait_digest(stats_state, min_samples=11) is None
+
+
+def test_live_digest_is_reused_between_flushes():
+    """Consecutive flushes from one worker do not rebuild the digest."""
+    metrics = PacerMetrics(rate_windows=[60])
+    stats_state = _record(metrics, metrics.new_state(), DIGEST_FLUSH_THRESHOLD)
+    live_digest = metrics._live_digests["duration_digest"][1]
+
+    stats_state = _record(metrics, stats_state, DIGEST_FLUSH_THRESHOLD)
+
+    assert metrics._live_digests["duration_digest"][1] is live_digest
+    assert metrics.get_duration_digest(stats_state).n_values == 2 * DIGEST_FLUSH_THRESHOLD
+
+
+def test_samples_from_other_workers_are_kept():
+    """A digest flushed by another instance is reloaded, not overwritten."""
+    first = PacerMetrics(rate_windows=[60])
+    second = PacerMetrics(rate_windows=[60])
+
+    stats_state = _record(first, first.new_state(), DIGEST_FLUSH_THRESHOLD)
+    stats_state = _record(second, stats_state, DIGEST_FLUSH_THRESHOLD)
+    stale_digest = first._live_digests["duration_digest"][1]
+    stats_state = _record(first, stats_state, DIGEST_FLUSH_THRESHOLD)
+
+    assert first._live_digests["duration_digest"][1] is not stale_digest
+    assert first.get_sample_count(stats_state) == 3 * DIGEST_FLUSH_THRESHOLD
+    assert first.get_duration_digest(stats_state).n_values == 3 * DIGEST_FLUSH_THRESHOLD
+    assert first.get_wait_digest(stats_state).n_values == 3 * DIGEST_FLUSH_THRESHOLD
+
+
+def test_call_timestamps_stay_sorted_and_bounded():
+    """Out-of-order timestamps are inserted in order and expired ones dropped."""
+    metrics = PacerMetrics(rate_windows=[10, 60])
+    stats_state = metrics.new_state()
+    for seconds in (100, 130, 120, 165):
+        stats_state = metrics.track_call_timestamp(stats_state, seconds * NANOSECONDS_PER_SECOND)
+
+    assert stats_state["call_timestamps"] == [s * NANOSECONDS_PER_SECOND for s in (120, 130, 165)]
+
+
+def test_batched_timestamps_match_one_by_one_tracking():
+    """Tracking a batch gives the same list as tracking each timestamp in turn."""
+    metrics = PacerMetrics(rate_windows=[10, 60])
+    seconds = (100, 165, 130, 120, 190)
+    one_by_one = metrics.new_state()
+    for s in seconds:
+        one_by_one = metrics.track_call_timestamp(one_by_one, s * NANOSECONDS_PER_SECOND)
+
+    batched = metrics.track_call_timestamps(
+        metrics.new_state(), [s * NANOSECONDS_PER_SECOND for s in seconds]
+    )
+
+    assert batched["call_timestamps"] == one_by_one["call_timestamps"]
+    assert batched["call_timestamps"] == [s * NANOSECONDS_PER_SECOND for s in (130, 165, 190)]
+
+
+def test_windowed_rates_count_calls_per_window():
+    """Each window counts only the calls whose timestamps fall inside it."""
+    metrics = PacerMetrics(rate_windows=[10, 60])
+    now = time.perf_counter_ns()
+    stats_state = {"call_timestamps": [now - s * NANOSECONDS_PER_SECOND for s in (50, 30, 5, 1)]}
+
+    rates = metrics.calculate_windowed_rates(stats_state)
+
+    assert rates == {10: pytest.approx(720), 60: pytest.approx(240)}
+
+
+def test_flushed_digest_is_stored_as_packed_centroids():
+    """The persisted digest packs its centroids instead of a list of dicts."""
+    metrics = PacerMetrics(rate_windows=[60])
+    stats_state = _record(metrics, metrics.new_state(), DIGEST_FLUSH_THRESHOLD)
+
+    stored = stats_state["duration_digest"]
+    assert "centroids" not in stored
+    assert isinstance(stored["means"], str)
+    assert isinstance(stored["weights"], str)
+
+    # A fresh instance rebuilds the same digest from the packed form
+    digest = PacerMetrics(rate_windows=[60]).get_duration_digest(stats_state)
+    assert digest.n_values == DIGEST_FLUSH_THRESHOLD
+    live_digest = metrics._live_digests["duration_digest"][1]
+    assert digest.percentile(90) == live_digest.percentile(90)
+
+
+def test_snapshot_for_event_reuses_digests_until_state_changes():
+    """Unchanged statistics yield the same digest objects; new samples rebuild them."""
+    metrics = PacerMetrics(rate_windows=[60])
+    stats_state = _record(metrics, metrics.new_state(), DIGEST_FLUSH_THRESHOLD + 5)
+
+    duration_digest, wait_digest, sample_count = metrics.snapshot_for_event(stats_state)
+    assert sample_count == DIGEST_FLUSH_THRESHOLD + 5
+    assert metrics.snapshot_for_event(stats_state) == (duration_digest, wait_digest, sample_count)
+
+    stats_state = _record(metrics, stats_state, 1)
+    new_duration_digest, _, _ = metrics.snapshot_for_event(stats_state)
+    assert new_duration_digest is not duration_digest
+    assert new_duration_digest.n_values == DIGEST_FLUSH_THRESHOLD + 6
+    assert metrics.snapshot_for_event(stats_state, min_samples=1000) == (None, None, DIGEST_FLUSH_THRESHOLD + 6)
+
+
+def test_windowed_rates_independent_of_window_order():
+    """Windows configured in any order get the same counts."""
+    now = time.perf_counter_ns()
+    stats_state = {"call_timestamps": [now - s * NANOSECONDS_PER_SECOND for s in (50, 30, 20, 5, 1)]}
+
+    rates = PacerMetrics(rate_windows=[60, 10, 25]).calculate_windowed_rates(stats_state)
+
+    assert rates == {
+        10: pytest.approx(2 * 360),
+        25: pytest.approx(3 * 144),
+        60: pytest.approx(5 * 60),
+    }
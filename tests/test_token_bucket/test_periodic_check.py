@@ -1,7 +1,11 @@
 """Tests for periodic check callback functionality."""
+import dataclasses
 import time
 
+import pytest
+
 from pytest_xdist_rate_limit import PeriodicCheckEvent, Rate, TokenBucketPacer
+from pytest_xdist_rate_limit.token_bucket_rate_limiter import PACER_STATE_LAYOUT
 
 
 def test_periodic_check_callback_invoked(make_shared_json):
@@ -264,6 +268,86 @@ def test_periodic_check_no_callback_no_error(make_shared_json):
         with limiter():
             time.sleep(0.01)
 
+    # Nothing consumes the statistics, so none are collected
+    assert "statistics" not in limiter.shared_state.read()
+
+
+def test_statistics_are_buffered_until_flushed(make_shared_json):
+    """Test that call statistics reach shared state in batches, not on every call."""
+    limiter = TokenBucketPacer(
+        shared_state=make_shared_json(name="test_stats_buffer"),
+        hourly_rate=Rate.per_hour(3600),
+        num_calls_between_checks=100,
+        on_periodic_check_callback=lambda event: None,
+    )
+
+    with limiter():
+        pass
+
+    # The first call's statistics are written while the second call holds the lock
+    assert "statistics" not in limiter.shared_state.read()
+    with limiter():
+        pass
+    assert limiter.shared_state.read()["statistics"]["sample_count"] == 1
+
+    assert limiter.flush_statistics()["sample_count"] == 2
+    assert limiter.shared_state.read()["statistics"]["sample_count"] == 2
+
+
+def test_statistics_lag_is_bounded_per_worker(make_shared_json):
+    """Test that a worker that never hits a checkpoint still writes its statistics.
+
+    With separate counter state, buffered statistics are not written during
+    reservations, so each worker must flush them on its own.
+    """
+    num_calls_between_checks = 5
+
+    def make_worker():
+        return TokenBucketPacer(
+            shared_state=make_shared_json(name="test_stats_lag"),
+            counter_state=make_shared_json(name="test_stats_lag_counters", layout=PACER_STATE_LAYOUT),
+            hourly_rate=Rate.per_second(1000),
+            num_calls_between_checks=num_calls_between_checks,
+            on_periodic_check_callback=lambda event: None,
+        )
+
+    first, second = make_worker(), make_worker()
+    calls = 0
+    for _ in range(20):
+        # Global call counts 5k+1 go to the second worker, so every checkpoint lands on the first
+        for worker in (second, first, first, first, first):
+            with worker():
+                pass
+            calls += 1
+            sample_count = first.shared_state.read().get("statistics", {}).get("sample_count", 0)
+            assert sample_count >= calls - 2 * (num_calls_between_checks - 1)
+
+    first.flush()
+    second.flush()
+    assert first.shared_state.read()["statistics"]["sample_count"] == calls
+
+
+def test_exceptions_are_counted_on_the_next_call(make_shared_json):
+    """Test that exception counts reach shared state with the next reservation or a flush."""
+    limiter = TokenBucketPacer(
+        shared_state=make_shared_json(name="test_exceptions_buffer"),
+        hourly_rate=Rate.per_second(1000),
+    )
+
+    with pytest.raises(ValueError):
+        with limiter():
+            raise ValueError("Test exception")
+    assert limiter.shared_state.read()["exceptions"] == 0
+
+    with limiter() as ctx:
+        assert ctx.exceptions == 1
+
+    with pytest.raises(ValueError):
+        with limiter():
+            raise ValueError("Test exception")
+    limiter.flush()
+    assert limiter.shared_state.read()["exceptions"] == 2
+
 
 def test_periodic_check_with_exceptions(make_shared_json):
     """Test that periodic check still works when exceptions occur."""
@@ -330,3 +414,54 @@ def test_periodic_check_duration_excludes_wait_time(make_shared_json):
     assert event.wait_p50 is not None
     # With 2 calls/second rate and burst=1, we expect significant wait times
     assert event.wait_p50 > 0
+
+
+def test_periodic_check_percentiles_computed_once():
+    """Test that repeated percentile reads on an event reuse the first result."""
+    calls = []
+
+    class CountingDigest:
+        def percentile(self, p):
+            calls.append(p)
+            return p / 1000
+
+    event = PeriodicCheckEvent(
+        limiter_id="test_cached_percentiles",
+        limiter=None,
+        state_snapshot={"call_count": 10, "exceptions": 0, "start_time": time.time()},
+        worker_count=1,
+        duration_digest=CountingDigest(),
+        wait_digest=CountingDigest(),
+        windowed_rates={},
+        sample_count=10,
+        target_rate=3600,
+        current_rate=3600,
+        drift=0.0,
+    )
+
+    str(event)
+    str(event)
+    assert event.wait_ratio == 1.0
+
+    assert sorted(calls) == [50, 50]
+
+
+def test_periodic_check_event_is_frozen():
+    """Test that event fields cannot be reassigned by callbacks."""
+    event = PeriodicCheckEvent(
+        limiter_id="test_frozen",
+        limiter=None,
+        state_snapshot={"call_count": 10, "exceptions": 0, "start_time": time.time()},
+        worker_count=1,
+        duration_digest=None,
+        wait_digest=None,
+        windowed_rates={},
+        sample_count=0,
+        target_rate=3600,
+        current_rate=0,
+        drift=None,
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.sample_count = 5
+    assert event.duration_p50 is None
@@ -16,6 +16,10 @@ def test_rate_limit_per_second():
     rate = Rate.per_second(0.5)
     assert rate.calls_per_hour == 1800
 
+    # 0.29 * 3600 is 1043.9999999999998 in floating point
+    rate = Rate.per_second(0.29)
+    assert rate.calls_per_hour == 1044
+
 
 def test_rate_limit_per_minute():
     """Test Rate.per_minute factory method."""
@@ -50,6 +54,15 @@ def test_rate_limit_per_day():
     assert rate.calls_per_hour == 100
 
 
+def test_rate_limit_factories_round_down_at_half_calls():
+    """Test that fractional calls per hour are rounded down, never up."""
+    assert Rate.per_day(36).calls_per_hour == 1
+    assert Rate.per_day(60).calls_per_hour == 2
+    assert Rate.per_day(84).calls_per_hour == 3
+    assert Rate.per_minute(0.025).calls_per_hour == 1
+    assert Rate.per_second(3.5 / 3600).calls_per_hour == 3
+
+
 def test_rate_limit_direct_construction():
     """Test direct Rate construction."""
     rate = Rate(5000)
@@ -158,3 +171,13 @@ pytest_plugins = ['pytest_xdist_rate_limit.shared_json']
     result = run_with_timeout(pytester, "-n", "2", "-v")
     outcomes = result.parseoutcomes()
     assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
+def test_rate_limit_factories_share_instances():
+    """Test that factory methods reuse instances and rates compare by value."""
+    assert Rate.per_second(10) is Rate.per_second(10)
+    assert Rate.per_minute(15) is Rate.per_minute(15)
+
+    assert Rate.per_second(1) == Rate.per_minute(60) == Rate(3600)
+    assert Rate.per_second(1) != Rate.per_second(2)
+    assert len({Rate.per_second(1), Rate.per_hour(3600)}) == 1
@@ -132,6 +132,49 @@ def test_exception_tracking(pytester, run_with_timeout):
     assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
 
 
+def test_unflushed_counts_are_written_when_pacer_is_collected(pytester, run_with_timeout):
+    """Test that a pacer built directly writes buffered counts when garbage collected."""
+    pytester.makeconftest(CONFTEST_CONTENT)
+    pytester.makepyfile(
+        """
+        import gc
+        import pytest
+        from pytest_xdist_rate_limit import (
+            TokenBucketPacer,
+            Rate
+        )
+
+        def test_unflushed_counts(make_shared_json):
+            shared = make_shared_json(name="unflushed_test")
+            limiter = TokenBucketPacer(
+                shared_state=shared,
+                hourly_rate=Rate.per_second(10),
+                burst_capacity=10,
+                on_periodic_check_callback=lambda event: None
+            )
+
+            with limiter():
+                pass
+            with pytest.raises(ValueError):
+                with limiter():
+                    raise ValueError("Test error")
+
+            # Nothing flushed yet: the exception waits for the next reservation
+            assert shared.read()["exceptions"] == 0
+
+            del limiter
+            gc.collect()
+
+            data = shared.read()
+            assert data["exceptions"] == 1
+            assert data["statistics"]["sample_count"] == 2
+        """
+    )
+    result = run_with_timeout(pytester, "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
 def test_max_calls_limit(pytester, run_with_timeout):
     """Test max_calls limit and callback."""
     pytester.makeconftest(CONFTEST_CONTENT)
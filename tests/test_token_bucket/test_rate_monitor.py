@@ -0,0 +1,82 @@
+"""Tests for RateMonitor drift check cadence and worker count."""
+
+import time
+
+from pytest_xdist_rate_limit import Rate, TokenBucketPacer
+from pytest_xdist_rate_limit.rate_monitor import MAX_DRIFT_CHECK_STRIDE, RateMonitor
+
+
+def _state(call_count, elapsed):
+    return {"start_time": time.time() - elapsed, "call_count": call_count, "exceptions": 0}
+
+
+def _count_drift_checks(monitor, state, checkpoints, target_rate=3600):
+    checks = []
+    monitor._log_rate_check = lambda *args: checks.append(args)
+    for _ in range(checkpoints):
+        monitor.check_rate(state=state, limiter_id="test", target_rate=target_rate, limiter=None)
+    return len(checks)
+
+
+def test_drift_checked_every_checkpoint_by_default():
+    """Without adaptive checks, every checkpoint checks drift."""
+    monitor = RateMonitor(max_drift=0.2, seconds_before_first_check=0)
+    assert _count_drift_checks(monitor, _state(100, 100), 20) == 20
+
+
+def test_adaptive_drift_checks_back_off_when_on_target():
+    """With no drift, the stride doubles after each check."""
+    monitor = RateMonitor(max_drift=0.2, seconds_before_first_check=0, adaptive_drift_checks=True)
+    # Strides 2, 4, 8, 16 -> checks at checkpoints 1, 3, 7, 15 within 20 checkpoints
+    assert _count_drift_checks(monitor, _state(100, 100), 20) == 4
+
+    for _ in range(10):
+        monitor._adapt_drift_check_stride(0.0)
+    assert monitor._drift_check_stride == MAX_DRIFT_CHECK_STRIDE
+
+
+def test_adaptive_drift_checks_tighten_on_drift():
+    """Drift above max_drift/2 halves the stride; drift violations are still reported."""
+    events = []
+    monitor = RateMonitor(
+        max_drift=0.2,
+        seconds_before_first_check=0,
+        on_drift_callback=events.append,
+        adaptive_drift_checks=True,
+    )
+    monitor._drift_check_stride = 8
+
+    # Twice the target rate: 100% drift
+    assert _count_drift_checks(monitor, _state(200, 100), 6) == 2
+    assert monitor._drift_check_stride == 2
+    assert len(events) == 2
+
+
+def test_checkpoints_skipped_without_callbacks(make_shared_json):
+    """A pacer with no callbacks and no max_calls never runs monitor checks."""
+    checkpoints = []
+
+    for name, max_calls in (("test_no_monitoring", -1), ("test_max_calls_monitoring", 10)):
+        pacer = TokenBucketPacer(
+            shared_state=make_shared_json(name=name),
+            hourly_rate=Rate.per_second(1000),
+            num_calls_between_checks=1,
+            max_calls=max_calls,
+        )
+        pacer.rate_monitor.on_checkpoint = lambda **kwargs: checkpoints.append(kwargs)
+        for _ in range(3):
+            with pacer() as ctx:
+                pass
+        assert ctx.call_count == 3
+
+    # Only the pacer with max_calls set reached the monitor
+    assert len(checkpoints) == 3
+
+
+def test_worker_count_is_read_per_monitor(monkeypatch):
+    """Each monitor reads the worker count of its own session, not a cached one."""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+    assert RateMonitor(max_drift=0.2, seconds_before_first_check=0)._worker_count == 4
+
+    monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT")
+    assert RateMonitor(max_drift=0.2, seconds_before_first_check=0)._worker_count == 1
@@ -0,0 +1,128 @@
+"""
+Tests for local token slot reservation.
+
+With reservation_size > 1, a pacer reserves several token slots from the
+shared bucket in one trip and serves the following calls from a local queue.
+"""
+
+import time
+
+import pytest
+
+from pytest_xdist_rate_limit import (
+    Rate,
+    SharedJson,
+    TokenBucketPacer,
+)
+
+
+def _make_pacer(tmp_path, **kwargs):
+    shared_state = SharedJson(
+        data_file=tmp_path / "reservation.json",
+        lock_file=tmp_path / "reservation.lock",
+    )
+    kwargs.setdefault("num_calls_between_checks", 1000)
+    kwargs.setdefault("seconds_before_first_check", 100.0)
+    return TokenBucketPacer(shared_state=shared_state, **kwargs)
+
+
+def test_reservation_takes_batch_from_shared_state(tmp_path):
+    """One shared trip reserves reservation_size slots; call counts stay sequential."""
+    pacer = _make_pacer(
+        tmp_path, hourly_rate=Rate.per_second(1000), burst_capacity=100, reservation_size=5
+    )
+
+    with pacer() as ctx:
+        assert ctx.call_count == 1
+    assert pacer.shared_state.read()["call_count"] == 5
+
+    for expected in range(2, 6):
+        with pacer() as ctx:
+            assert ctx.call_count == expected
+    assert pacer.shared_state.read()["call_count"] == 5
+
+    with pacer() as ctx:
+        assert ctx.call_count == 6
+    assert pacer.shared_state.read()["call_count"] == 10
+
+
+def test_reservation_respects_rate(tmp_path):
+    """Reserved slots are still spaced according to the target rate."""
+    pacer = _make_pacer(
+        tmp_path, hourly_rate=Rate.per_second(10), burst_capacity=1, reservation_size=4
+    )
+
+    start = time.time()
+    for _ in range(6):
+        with pacer():
+            pass
+    elapsed = time.time() - start
+
+    # First call uses the burst token, the other 5 are paced at 10/s
+    assert elapsed >= 0.45, f"6 calls at 10/s took only {elapsed:.2f}s"
+
+
+def test_release_reserved_slots(tmp_path):
+    """Unused reserved slots are handed back to the shared bucket."""
+    pacer = _make_pacer(
+        tmp_path, hourly_rate=Rate.per_second(1000), burst_capacity=10, reservation_size=5
+    )
+
+    with pacer():
+        pass
+    state = pacer.shared_state.read()
+    assert state["call_count"] == 5
+    assert state["token_bucket"]["tokens"] == pytest.approx(5, abs=0.5)
+
+    pacer.release_reserved_slots()
+    state = pacer.shared_state.read()
+    assert state["call_count"] == 1
+    assert state["token_bucket"]["tokens"] == pytest.approx(9, abs=0.5)
+
+    # Releasing again is a no-op
+    pacer.release_reserved_slots()
+    assert pacer.shared_state.read()["call_count"] == 1
+
+
+def test_invalid_reservation_size(tmp_path):
+    """reservation_size must be positive."""
+    with pytest.raises(ValueError, match="reservation_size must be positive"):
+        _make_pacer(tmp_path, hourly_rate=Rate.per_second(1), reservation_size=0)
+
+
+def test_reservation_only_leases_available_tokens(tmp_path):
+    """Slots that would need a wait are not reserved ahead of time."""
+    pacer = _make_pacer(
+        tmp_path, hourly_rate=Rate.per_second(1), burst_capacity=3, reservation_size=10
+    )
+
+    with pacer() as ctx:
+        assert ctx.seconds_waited == 0.0
+    # Only the 3 burst tokens were available
+    assert pacer.shared_state.read()["call_count"] == 3
+
+    for _ in range(2):
+        with pacer() as ctx:
+            assert ctx.seconds_waited == 0.0
+    assert pacer.shared_state.read()["call_count"] == 3
+
+
+def test_reservation_does_not_count_past_max_calls(tmp_path):
+    """Batches shrink to the calls left before max_calls."""
+    pacer = _make_pacer(
+        tmp_path,
+        hourly_rate=Rate.per_second(1000),
+        burst_capacity=100,
+        reservation_size=5,
+        max_calls=7,
+    )
+
+    with pacer():
+        pass
+    assert pacer.shared_state.read()["call_count"] == 5
+
+    for _ in range(5):
+        with pacer():
+            pass
+    # The second batch only took the 2 calls left before the limit
+    assert pacer.shared_state.read()["call_count"] == 7
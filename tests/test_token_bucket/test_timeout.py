@@ -1,5 +1,12 @@
 """Tests for TokenBucketPacer timeout functionality."""
 
+import time
+
+import pytest
+
+from pytest_xdist_rate_limit import Rate, RateLimitTimeout, TokenBucketPacer
+
+
 def test_timeout_not_exceeded(pytester, run_with_timeout):
     """Test that timeout is not raised when wait time is within limit."""
     pytester.makepyfile(
@@ -288,3 +295,28 @@ def test_timeout_error_attributes(pytester, run_with_timeout):
     outcomes = result.parseoutcomes()
     assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
 
+
+def test_bucket_stored_under_another_monotonic_epoch_is_reset(make_shared_json):
+    """Test that bucket times persisted before a reboot do not schedule calls far ahead."""
+    limiter = TokenBucketPacer(
+        shared_state=make_shared_json(name="stale_epoch_test"),
+        hourly_rate=Rate.per_second(1),
+        burst_capacity=1,
+    )
+    # Written by a run whose monotonic clock was a day ahead of this boot's
+    day = 24 * 3600
+    limiter.shared_state.update({
+        "start_time": time.time() - day,
+        "call_count": 5,
+        "exceptions": 0,
+        "monotonic_epoch": time.time() - time.monotonic() - day,
+        "token_bucket": {"last_refill_time": time.monotonic() + day, "tokens": 0.0},
+    })
+
+    with limiter(timeout=1.0) as ctx:
+        assert ctx.seconds_waited == 0.0
+
+    # The reset bucket is stored with this boot's epoch and paces as usual
+    with pytest.raises(RateLimitTimeout):
+        with limiter(timeout=0.1):
+            pass
@@ -0,0 +1,86 @@
+"""Tests for TokenBucketAlgorithm and its state."""
+
+import pytest
+
+from pytest_xdist_rate_limit.token_bucket_algorithm import TokenBucketAlgorithm, TokenBucketState
+
+
+def test_state_round_trips_through_dict():
+    """The persisted dict form rebuilds an equal state."""
+    state = TokenBucketState(last_refill_time=10.0, tokens=2.5)
+
+    assert state.to_dict() == {"last_refill_time": 10.0, "tokens": 2.5}
+    assert TokenBucketState.from_dict(state.to_dict()) == state
+    with pytest.raises(AttributeError):
+        state.extra = 1
+
+
+def test_reserve_does_not_mutate_input_state():
+    """Reserving returns a new state and leaves the input untouched."""
+    algorithm = TokenBucketAlgorithm(hourly_rate=3600, burst_capacity=5)
+    state = TokenBucketState(last_refill_time=100.0, tokens=3.0)
+
+    wait_time, target_time, new_state = algorithm.reserve_token_slot(state, "test", current_time=100.0)
+
+    assert (wait_time, target_time) == (0.0, 100.0)
+    assert new_state == TokenBucketState(last_refill_time=100.0, tokens=2.0)
+    assert state == TokenBucketState(last_refill_time=100.0, tokens=3.0)
+
+
+def test_changing_parameters_rebuilds_reservation_step():
+    """New rate and capacity values take effect on the next reservation."""
+    algorithm = TokenBucketAlgorithm(hourly_rate=3600, burst_capacity=1)
+    empty = TokenBucketState(last_refill_time=100.0, tokens=0.0)
+
+    assert algorithm.reserve_token_slot(empty, "test", current_time=100.0)[0] == pytest.approx(1.0)
+
+    algorithm.hourly_rate = 7200
+    assert algorithm.reserve_token_slot(empty, "test", current_time=100.0)[0] == pytest.approx(0.5)
+
+    algorithm.burst_capacity = 5
+    refilled = algorithm.reserve_token_slot(empty, "test", current_time=110.0)[2]
+    assert refilled.tokens == pytest.approx(4.0)
+
+
+def test_release_rewinds_whole_slots():
+    """Released future slots move the schedule back by whole slots, with no extra tokens."""
+    algorithm = TokenBucketAlgorithm(hourly_rate=7, burst_capacity=1)
+    state = TokenBucketState(last_refill_time=100.0, tokens=0.0)
+    slot_times = []
+    for _ in range(3):
+        _, target_time, state = algorithm.reserve_token_slot(state, "test", current_time=100.0)
+        slot_times.append(target_time)
+
+    released = algorithm.release_token_slots(state, slot_times, current_time=100.0)
+
+    assert released.last_refill_time == pytest.approx(100.0)
+    assert released.tokens == 0.0
+
+
+def test_release_only_rewinds_the_tail_of_the_schedule():
+    """Slots behind another worker's reservation are dropped instead of rewound."""
+    algorithm = TokenBucketAlgorithm(hourly_rate=3600, burst_capacity=1)
+    state = TokenBucketState(last_refill_time=100.0, tokens=0.0)
+    first_slots, second_slots = [], []
+    for slots in (first_slots, second_slots, first_slots):
+        _, target_time, state = algorithm.reserve_token_slot(state, "test", current_time=100.0)
+        slots.append(target_time)
+    assert (first_slots, second_slots) == ([101.0, 103.0], [102.0])
+
+    # The second worker's slot is followed by one of the first worker's
+    assert algorithm.release_token_slots(state, second_slots, current_time=100.0) == state
+
+    # Only the first worker's last slot is handed back; the next one still follows 102
+    released = algorithm.release_token_slots(state, first_slots, current_time=100.0)
+    assert released.last_refill_time == pytest.approx(102.0)
+    assert algorithm.reserve_token_slot(released, "test", current_time=100.0)[1] == pytest.approx(103.0)
+
+
+def test_release_credits_due_slots_as_tokens():
+    """Slots whose time has come are returned as tokens, capped at burst capacity."""
+    algorithm = TokenBucketAlgorithm(hourly_rate=3600, burst_capacity=5)
+    state = TokenBucketState(last_refill_time=100.0, tokens=3.0)
+
+    released = algorithm.release_token_slots(state, [100.0, 100.0, 100.0], current_time=100.5)
+
+    assert released == TokenBucketState(last_refill_time=100.0, tokens=5.0)
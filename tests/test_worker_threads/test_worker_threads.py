@@ -0,0 +1,46 @@
+"""Tests for the limit_worker_threads fixture."""
+
+import pytest
+
+from pytest_xdist_rate_limit.worker_threads import worker_thread_limit
+
+
+def test_worker_thread_limit():
+    """Test that CPUs are split evenly across workers, with at least one thread."""
+    assert worker_thread_limit(4, cpu_count=16) == 4
+    assert worker_thread_limit(3, cpu_count=16) == 5
+    assert worker_thread_limit(32, cpu_count=16) == 1
+    assert worker_thread_limit(0, cpu_count=8) == 8
+
+
+def test_limit_disabled_by_default(pytester, run_with_timeout):
+    """Test that no limit is applied unless the ini option is set."""
+    pytester.makepyfile("""
+        def test_no_limit(limit_worker_threads):
+            assert limit_worker_threads is None
+    """)
+
+    result = run_with_timeout(pytester, "-n", "2", "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)
+
+
+def test_limit_applied_under_xdist(pytester, run_with_timeout):
+    """Test that enabling the ini option caps thread pools in each worker."""
+    pytest.importorskip("threadpoolctl")
+    pytester.makeini("""
+        [pytest]
+        limit_worker_threads = true
+    """)
+    pytester.makepyfile("""
+        import os
+        from pytest_xdist_rate_limit.worker_threads import worker_thread_limit
+
+        def test_limit(limit_worker_threads):
+            expected = worker_thread_limit(int(os.environ["PYTEST_XDIST_WORKER_COUNT"]))
+            assert limit_worker_threads == expected
+    """)
+
+    result = run_with_timeout(pytester, "-n", "2", "-v")
+    outcomes = result.parseoutcomes()
+    assert "passed" in outcomes and outcomes["passed"] == 1, str(result.stdout)